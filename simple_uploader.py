@@ -2,7 +2,7 @@
 """
 Simple BrowserStack Uploader - Beginner-Friendly Version
 =========================================================
-This is a simplified version using only FUNCTIONS (no classes).
+This is a simplified version using FUNCTIONS (plus one tiny helper class).
 Perfect for learning Python!
 
 What this script does:
@@ -24,21 +24,87 @@ Usage:
 
 import os
 import sys
+import copy
+import functools
 import json
+import re
+import string
 import yaml
 import hashlib
 import argparse
 import requests
 import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
+
+# Use the fast C (libyaml) loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 
 # =============================================================================
 # 1. CONFIGURATION FUNCTIONS
 # =============================================================================
 
+# Matches ${VAR_NAME} placeholders in configuration values
+ENV_VAR_PATTERN = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+# Parsed YAML files, keyed by absolute path (most recently used at the end)
+_YAML_CACHE = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 100
+_YAML_CACHE_LOCK = threading.Lock()  # Files may be loaded from several threads
+
+
+def _cached_yaml_load(file_path):
+    """
+    Load a YAML file, reusing the parsed result if the file hasn't changed
+
+    The file's modification time and size are checked on every call, so an
+    edited file is always parsed again. Callers get their own deep copy and
+    are free to modify it.
+
+    Args:
+        file_path (str or Path): Path to YAML file
+
+    Returns:
+        Parsed YAML content (dict, list, etc.)
+    """
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            # Cache hit - mark as recently used
+            _YAML_CACHE.move_to_end(path)
+            return copy.deepcopy(cached[1])
+
+    # Cache miss - parse the file
+    with open(path, 'r') as f:
+        content = yaml.load(f, Loader=SafeLoader)
+
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[path] = (key, content)
+        _YAML_CACHE.move_to_end(path)
+
+        # Evict least recently used entries
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(content)
+
+
 def load_config(config_file='config/config.yaml'):
     """
     Load configuration from YAML file
@@ -46,6 +112,11 @@ def load_config(config_file='config/config.yaml'):
     This reads the config file and replaces environment variables.
     For example: ${BROWSERSTACK_USER} becomes the actual username.
 
+    The parsed YAML (before environment variables are replaced) is saved
+    next to the config file as JSON, e.g. config.yaml.json, together with
+    the YAML file's modification time and size. Later runs read that JSON
+    instead, which is much faster, as long as both still match exactly.
+
     Args:
         config_file (str): Path to config file
 
@@ -54,56 +125,204 @@ def load_config(config_file='config/config.yaml'):
     """
     print(f"📋 Loading configuration from {config_file}...")
 
-    # Read the YAML file
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    yaml_path = Path(config_file)
+    json_cache = Path(str(yaml_path) + '.json')
+
+    # Identifies the YAML file the cache was made from (taken before reading
+    # it, so an edit made while reading means a cache miss next time)
+    st = yaml_path.stat()
+    stamp = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
 
-    # Replace environment variables
-    config = replace_env_vars(config)
+    config = None
+    try:
+        # Use the JSON cache only if it was made from this exact YAML file
+        with open(json_cache, 'r') as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and cached.get('source') == stamp:
+            config = cached['config']
+    except (OSError, ValueError, KeyError):
+        # Missing or broken cache - fall back to the YAML file
+        config = None
+
+    if config is None:
+        # Read the YAML file (cached while the file is unchanged)
+        config = _cached_yaml_load(yaml_path)
+
+        # JSON turns keys like 1 or true into strings, so the cache would
+        # give a different config than the YAML file - don't cache those
+        if _has_only_str_keys(config):
+            _write_json_cache(json_cache, {'source': stamp, 'config': config})
+
+    # Replace environment variables (using one snapshot of the environment)
+    config = replace_env_vars(config, env=dict(os.environ))
+
+    # Precompute YAML filename lookups (see get_yaml_filename)
+    config['_yaml_filename_index'] = build_yaml_filename_index(config)
 
     print("✅ Configuration loaded successfully")
     return config
 
 
-def replace_env_vars(obj):
+def _has_only_str_keys(data):
+    """
+    Check that every dictionary key in parsed YAML is a string
+
+    Args:
+        data: Parsed YAML content
+
+    Returns:
+        bool: True if the data reads back from JSON with the same keys
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if not all(isinstance(key, str) for key in obj):
+                return False
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return True
+
+
+def _write_json_cache(cache_path, data):
+    """
+    Save parsed configuration as JSON for faster loading next time
+
+    Writes to a temporary file first and then renames it, so other runs
+    never see a half-written cache. The file is only readable by its owner
+    (0600), because the config may contain tokens. Failures are ignored
+    (for example when the config folder is read-only) because the cache is
+    only an optimization.
+
+    Args:
+        cache_path (Path): Where to write the JSON cache
+        data: Cache contents (YAML file stamp and parsed configuration)
+    """
+    tmp_path = None
+    try:
+        # mkstemp creates the file with mode 0600
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix='.tmp'
+        )
+        with open(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Not JSON-serializable or not writable - just skip caching
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def replace_env_vars(obj, env=None):
     """
     Replace ${VAR_NAME} with actual environment variable values
 
-    This function is recursive - it can handle nested dictionaries and lists.
+    Walks nested dictionaries and lists with a simple stack (no recursion)
+    and updates them in place. Placeholders are found with a regular
+    expression, so they also work inside longer strings such as
+    "https://${HOST}/api".
+
+    Each value is handled by looking up its exact type in _VALUE_HANDLERS
+    (one dict lookup instead of a chain of isinstance checks). Numbers,
+    booleans and None have no handler and are left as-is.
 
     Args:
         obj: Can be dict, list, string, or other
+        env (dict): Environment variables to use (default: a snapshot of
+            os.environ taken once for the whole walk)
 
     Returns:
         Object with environment variables replaced
     """
-    if isinstance(obj, dict):
-        # For dictionaries, process each key-value pair
-        return {key: replace_env_vars(value) for key, value in obj.items()}
-
-    elif isinstance(obj, list):
-        # For lists, process each item
-        return [replace_env_vars(item) for item in obj]
-
-    elif isinstance(obj, str):
-        # For strings, check if it's an environment variable
-        if obj.startswith('${') and obj.endswith('}'):
-            var_name = obj[2:-1]  # Remove ${ and }
-            value = os.getenv(var_name)
-            if value is None:
-                raise ValueError(f"❌ Environment variable not set: {var_name}")
-            return value
+    if env is None:
+        env = dict(os.environ)
+
+    # A plain string (or number, etc.) at the top level
+    kind = type(obj)
+    if kind is str:
+        return _substitute_string(obj, env)
+    if kind is not dict and kind is not list:
         return obj
 
-    else:
-        # For other types (numbers, booleans), return as-is
-        return obj
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+
+        # Dictionaries are walked by key, lists by index
+        if type(container) is dict:
+            items = container.items()
+        else:
+            items = enumerate(container)
+
+        for key, value in items:
+            handler = _VALUE_HANDLERS.get(type(value))
+            if handler is not None:
+                handler(container, key, value, stack, env)
+
+    return obj
+
+
+def _queue_container(container, key, value, stack, env):
+    """Nested dict/list: walk it later"""
+    stack.append(value)
+
+
+def _replace_string(container, key, value, stack, env):
+    """String: replace placeholders and store the result"""
+    container[key] = _substitute_string(value, env)
+
+
+# How each value type is handled while walking the configuration
+_VALUE_HANDLERS = {
+    dict: _queue_container,
+    list: _queue_container,
+    str: _replace_string,
+}
+
+
+def _substitute_string(text, env):
+    """
+    Replace every ${VAR_NAME} in a string with its environment variable
+
+    Args:
+        text (str): String that may contain placeholders
+        env (dict): Environment variables to look names up in
+
+    Returns:
+        str: String with placeholders replaced
+
+    Raises:
+        ValueError: If an environment variable is not set
+    """
+    # Most strings have no placeholder at all - skip the regex for them
+    if '$' not in text:
+        return text
+
+    def lookup(match):
+        var_name = match.group(1)
+        value = env.get(var_name)
+        if value is None:
+            raise ValueError(f"❌ Environment variable not set: {var_name}")
+        return value
+
+    return ENV_VAR_PATTERN.sub(lookup, text)
 
 
 # =============================================================================
 # 2. FILE OPERATIONS
 # =============================================================================
 
+# A top-level "key:" line in a YAML file (no indentation, not a comment)
+TOP_LEVEL_KEY_PATTERN = re.compile(r'^([A-Za-z_][\w-]*):', re.MULTILINE)
+
+# "updates:" followed by a block list written by yaml.dump ("- ..." items)
+UPDATES_LIST_PATTERN = re.compile(r'updates:[ \t]*\r?\n- ')
+
+
 def build_artifact_path(config, platform, environment, build_type, app_variant, src_folder=None):
     """
     Build the full path to the artifact file
@@ -138,19 +357,54 @@ def build_artifact_path(config, platform, environment, build_type, app_variant,
         base_path = config['local_storage']['artifact_base_path']
 
     # Replace all placeholders in the template
-    artifact_path = template.format(
-        base=base_path,
-        platform=platform,
-        environment=environment,
-        build_type=build_type,
-        build_type_lower=build_type.lower(),
-        app_variant=app_variant
+    values = {
+        'base': base_path,
+        'platform': platform,
+        'environment': environment,
+        'build_type': build_type,
+        'build_type_lower': build_type.lower(),
+        'app_variant': app_variant
+    }
+    artifact_path = ''.join(
+        literal if field is None else values[field]
+        for literal, field in compile_path_template(template)
     )
 
     print(f"📁 Artifact path: {artifact_path}")
     return artifact_path
 
 
+@functools.lru_cache(maxsize=64)
+def compile_path_template(template):
+    """
+    Split a path template into pieces once, so it can be filled in quickly
+
+    Example:
+        "{base}/app-{build_type_lower}.apk" becomes
+        (('base' field), '/app-', ('build_type_lower' field), '.apk')
+
+    The result is cached, so each template is only parsed once.
+
+    Args:
+        template (str): Path template with {placeholders}
+
+    Returns:
+        tuple: (literal, field_name) pairs; field_name is None for plain text
+
+    Raises:
+        ValueError: If a placeholder uses a format spec or conversion
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append((literal, None))
+        if field_name is not None:
+            if format_spec or conversion:
+                raise ValueError(f"❌ Unsupported placeholder in path template: {template}")
+            parts.append((None, field_name))
+    return tuple(parts)
+
+
 def validate_artifact_file(artifact_path):
     """
     Validate that the artifact file exists and is valid
@@ -165,45 +419,45 @@ def validate_artifact_file(artifact_path):
         artifact_path (str): Path to artifact
 
     Returns:
-        dict: File information (path, size, md5, etc.)
+        dict: File information (path, name, size, extension)
     """
     print(f"🔍 Validating artifact: {artifact_path}")
 
     path = Path(artifact_path)
 
-    # Check 1: Does file exist?
-    if not path.exists():
+    # Checks 1-2: Does the file exist and is it readable?
+    # We don't ask first - we just open it (the normal case) and turn the
+    # rare failures into clear errors. The open file also gives us the size
+    # and the magic bytes (first 2 bytes should be 'PK' for APK/IPA).
+    try:
+        with open(artifact_path, 'rb', buffering=0) as f:
+            file_size = os.fstat(f.fileno()).st_size
+            magic_bytes = f.read(2)
+    except FileNotFoundError:
         raise FileNotFoundError(f"❌ Artifact not found: {artifact_path}")
-
-    # Check 2: Is file readable?
-    if not os.access(artifact_path, os.R_OK):
+    except PermissionError:
         raise PermissionError(f"❌ Cannot read artifact: {artifact_path}")
+    except IsADirectoryError:
+        raise ValueError(f"❌ Artifact is a directory, not a file: {artifact_path}")
 
-    # Check 3: Get file size
-    file_size = path.stat().st_size
     file_size_mb = round(file_size / (1024 * 1024), 2)
 
-    # Check 4: Validate file extension
+    # Check 3: Validate file extension
     extension = path.suffix
     if extension not in ['.apk', '.aab', '.ipa']:
         raise ValueError(f"❌ Invalid file extension: {extension}")
 
-    # Check 5: Check magic bytes (first 2 bytes should be 'PK' for APK/IPA)
-    with open(artifact_path, 'rb') as f:
-        magic_bytes = f.read(2)
-
+    # Check 4: Validate file signature
     if magic_bytes != b'PK':
         raise ValueError(f"❌ Invalid file signature. Expected 'PK', got {magic_bytes}")
 
-    # Check 6: Calculate MD5 checksum
-    md5_hash = calculate_md5(artifact_path)
-
+    # Note: checksums are calculated while uploading (see HashingFileReader),
+    # so the file is only read once
     artifact_info = {
         'path': artifact_path,
         'name': path.name,
         'size': file_size,
         'size_mb': file_size_mb,
-        'md5': md5_hash,
         'extension': extension
     }
 
@@ -211,40 +465,97 @@ def validate_artifact_file(artifact_path):
     return artifact_info
 
 
-def calculate_md5(file_path):
+# =============================================================================
+# 3. BROWSERSTACK OPERATIONS
+# =============================================================================
+
+def create_http_session():
     """
-    Calculate MD5 checksum of a file
+    Create one HTTP session shared by all web requests in this script
 
-    Reads file in chunks for memory efficiency.
+    Reusing a session keeps connections open, so BrowserStack, GitHub and
+    Teams calls don't each pay for a new TCP + TLS handshake.
 
-    Args:
-        file_path (str): Path to file
+    Retries happen automatically on:
+    - 429 (Rate Limited)
+    - 500, 502, 503, 504 (Server Errors)
+    - Network errors
+
+    POST requests (uploads, pull requests, Teams cards) are only retried
+    when the connection could not be made: after the server has seen the
+    request, retrying could create a duplicate PR or Teams card.
 
     Returns:
-        str: MD5 hash in hexadecimal
+        requests.Session: Session with connection pooling and retries
     """
-    md5 = hashlib.md5()
+    session = requests.Session()
 
-    # Read file in 8KB chunks
-    with open(file_path, 'rb') as f:
-        while True:
-            chunk = f.read(8192)
-            if not chunk:
-                break
-            md5.update(chunk)
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.5,  # Wait 0.5s, 1s, 2s between retries
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry_strategy)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
 
-    return md5.hexdigest()
+    return session
 
 
-# =============================================================================
-# 3. BROWSERSTACK OPERATIONS
-# =============================================================================
+# Shared HTTP session (created once when the script starts)
+_session = create_http_session()
+
+# Upload retries: the file is streamed, so the session can't resend it and
+# upload_to_browserstack() retries by itself (these statuses, network errors)
+UPLOAD_ATTEMPTS = 4
+UPLOAD_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HashingFileReader:
+    """
+    File wrapper that calculates checksums while the file is being read
+
+    This is the only class in this script. It lets us hash the artifact
+    while it is uploaded, instead of reading the whole file twice.
+
+    Usage:
+        reader = HashingFileReader(f)
+        data = reader.read()
+        reader.hexdigests()  # {'md5': '...', 'sha256': '...'}
+    """
+
+    def __init__(self, f, algorithms=('md5', 'sha256')):
+        self.f = f
+        self.hashes = {name: hashlib.new(name) for name in algorithms}
+
+    def read(self, size=-1):
+        """Read from the file and feed the bytes into every hash"""
+        chunk = self.f.read(size)
+        for hash_obj in self.hashes.values():
+            hash_obj.update(chunk)
+        return chunk
+
+    def fileno(self):
+        """File descriptor of the wrapped file (used to find its size)"""
+        return self.f.fileno()
+
+    def tell(self):
+        """Current read position in the wrapped file"""
+        return self.f.tell()
+
+    def hexdigests(self):
+        """Return {algorithm: hex digest} for everything read so far"""
+        return {name: hash_obj.hexdigest() for name, hash_obj in self.hashes.items()}
+
 
 def upload_to_browserstack(config, artifact_path, custom_id):
     """
     Upload artifact to BrowserStack
 
     This sends the APK/IPA file to BrowserStack's API and gets back an app ID.
+    The file is streamed in small pieces (it is never fully loaded into
+    memory), and MD5 and SHA-256 checksums are calculated from the same
+    bytes as they are sent.
 
     Args:
         config (dict): Configuration dictionary
@@ -252,7 +563,7 @@ def upload_to_browserstack(config, artifact_path, custom_id):
         custom_id (str): Custom identifier for this upload
 
     Returns:
-        dict: Upload result with app_id
+        dict: Upload result with app_id, md5 and sha256
     """
     print(f"☁️  Uploading to BrowserStack...")
 
@@ -262,57 +573,84 @@ def upload_to_browserstack(config, artifact_path, custom_id):
     api_endpoint = config['browserstack']['api_endpoint']
     timeout = config['browserstack']['upload_timeout']
 
-    try:
-        # Open file in binary mode
-        with open(artifact_path, 'rb') as f:
-            # Prepare the upload
-            files = {'file': f}
-            data = {'custom_id': custom_id}
-
-            # Send POST request to BrowserStack
-            response = requests.post(
-                api_endpoint,
-                files=files,
-                data=data,
-                auth=(username, access_key),  # Basic authentication
-                timeout=timeout
-            )
+    for attempt in range(1, UPLOAD_ATTEMPTS + 1):
+        try:
+            # Open file in binary mode (again on every attempt: the upload
+            # reads it to the end, and the checksums must cover this attempt)
+            with open(artifact_path, 'rb') as f:
+                # Prepare the upload (hashing the bytes as they are read)
+                reader = HashingFileReader(f)
+                encoder = MultipartEncoder(fields={
+                    'custom_id': custom_id,
+                    'file': (Path(artifact_path).name, reader, 'application/octet-stream')
+                })
+
+                # Send POST request to BrowserStack (streams the file)
+                response = _session.post(
+                    api_endpoint,
+                    data=encoder,
+                    headers={'Content-Type': encoder.content_type},
+                    auth=(username, access_key),  # Basic authentication
+                    timeout=timeout
+                )
 
             # Check if request was successful
             response.raise_for_status()
 
-            # Parse the JSON response
-            result = response.json()
+        except requests.exceptions.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            retryable = (
+                status in UPLOAD_RETRY_STATUSES
+                or isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+            )
+            if not retryable or attempt == UPLOAD_ATTEMPTS:
+                print(f"❌ Upload failed: {e}")
+                raise
 
-            # Extract the app ID
-            app_id = result['app_url']
+            delay = 0.5 * 2 ** (attempt - 1)  # Wait 0.5s, 1s, 2s between retries
+            print(f"⚠️  Upload attempt {attempt} failed: {e}. Retrying in {delay:g}s...")
+            time.sleep(delay)
+            continue
 
-            print(f"✅ Upload successful! App ID: {app_id}")
+        # Parse the JSON response
+        result = response.json()
 
-            return {
-                'app_id': app_id,
-                'app_url': app_id,
-                'custom_id': custom_id,
-                'timestamp': datetime.utcnow().isoformat()
-            }
+        # Extract the app ID
+        app_id = result['app_url']
 
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Upload failed: {e}")
-        raise
+        checksums = reader.hexdigests()
+
+        print(f"✅ Upload successful! App ID: {app_id}")
+        print(f"🔐 MD5: {checksums['md5']}")
+
+        return {
+            'app_id': app_id,
+            'app_url': app_id,
+            'custom_id': custom_id,
+            'md5': checksums['md5'],
+            'sha256': checksums['sha256'],
+            'timestamp': datetime.utcnow().isoformat()
+        }
 
 
 # =============================================================================
 # 4. GIT OPERATIONS
 # =============================================================================
 
-def clone_git_repo(config):
+def clone_git_repo(config, sparse_paths=None):
     """
     Clone the YAML configuration repository
 
     Clones to a temporary directory for safety.
 
+    This is a partial clone (--filter=blob:none): file contents are only
+    downloaded when they are checked out. With sparse_paths, only those
+    files are checked out, so the rest of the repository is never
+    downloaded or written to disk.
+
     Args:
         config (dict): Configuration dictionary
+        sparse_paths (list): Optional files (relative to repo root) to check out
 
     Returns:
         str: Path to cloned repository
@@ -337,12 +675,26 @@ def clone_git_repo(config):
         )
 
     try:
-        # Clone the repository
-        run_command(['git', 'clone', '--depth', '1', repo_url, str(repo_path)])
-
-        # Configure git user
-        run_command(['git', 'config', 'user.name', user_name], cwd=str(repo_path))
-        run_command(['git', 'config', 'user.email', user_email], cwd=str(repo_path))
+        # Clone the repository and set the commit author in the same step
+        # (--config writes to the new repo's .git/config, so no extra
+        # 'git config' commands are needed)
+        clone_cmd = [
+            'git', 'clone', '--depth', '1', '--filter=blob:none',
+            '--config', f'user.name={user_name}',
+            '--config', f'user.email={user_email}',
+        ]
+        if sparse_paths:
+            # Start with an empty checkout; sparse-checkout fills it in
+            clone_cmd.append('--sparse')
+        run_command(clone_cmd + [repo_url, str(repo_path)])
+
+        if sparse_paths:
+            # Check out only the files we are going to update
+            patterns = ['/' + str(p).lstrip('/') for p in sparse_paths]
+            run_command(
+                ['git', 'sparse-checkout', 'set', '--no-cone'] + patterns,
+                cwd=str(repo_path)
+            )
 
         print(f"✅ Repository cloned to: {repo_path}")
         return str(repo_path)
@@ -352,6 +704,41 @@ def clone_git_repo(config):
         raise
 
 
+def prepare_git_repo(config, params):
+    """
+    Clone the YAML repository and switch to the branch we will commit to
+
+    If create_pr is enabled a new feature branch is created, otherwise the
+    target branch is checked out for a direct commit.
+
+    Args:
+        config (dict): Configuration dictionary
+        params (dict): Parameters dictionary
+
+    Returns:
+        tuple: (repo_path, branch_name, create_pr)
+    """
+    # Only check out the files we are going to update
+    yaml_filename = get_yaml_filename(config, params['platform'], params['app_variant'])
+    repo_path = clone_git_repo(config, sparse_paths=[yaml_filename, 'shared.yml'])
+
+    # Check if we should create a PR or commit directly
+    create_pr = config['git'].get('create_pr', True)
+
+    if create_pr:
+        # Create feature branch for PR
+        branch_name = f"browserstack-update/{params['platform']}/{params['app_variant']}/{params['build_id']}"
+        create_git_branch(repo_path, branch_name)
+        print(f"📝 Will create Pull Request from: {branch_name}")
+    else:
+        # Commit directly to target branch
+        branch_name = config['git'].get('target_branch', 'main')
+        checkout_existing_branch(repo_path, branch_name)
+        print(f"📝 Will commit directly to: {branch_name}")
+
+    return repo_path, branch_name, create_pr
+
+
 def create_git_branch(repo_path, branch_name):
     """
     Create a new Git branch
@@ -421,16 +808,14 @@ def commit_and_push(repo_path, branch_name, files, message):
     print("💾 Committing and pushing changes...")
 
     try:
-        # Stage files
-        for file_path in files:
-            run_command(['git', 'add', file_path], cwd=repo_path)
+        # Stage all files with a single git command
+        run_command(['git', 'add', '--'] + list(files), cwd=repo_path)
 
         # Commit
         run_command(['git', 'commit', '-m', message], cwd=repo_path)
 
-        # Get commit SHA
-        result = run_command(['git', 'rev-parse', 'HEAD'], cwd=repo_path, capture=True)
-        commit_sha = result.stdout.strip()
+        # Get commit SHA (read straight from .git, no extra git process)
+        commit_sha = read_head_sha(repo_path)
 
         # Push to remote
         run_command(['git', 'push', 'origin', branch_name], cwd=repo_path)
@@ -443,6 +828,51 @@ def commit_and_push(repo_path, branch_name, files, message):
         raise
 
 
+def read_head_sha(repo_path):
+    """
+    Get the commit SHA that HEAD points to
+
+    Reads .git/HEAD and the branch ref file directly, which is much faster
+    than starting 'git rev-parse HEAD'. Falls back to git if the ref can't
+    be found in a loose file or packed-refs.
+
+    Args:
+        repo_path (str): Path to repository
+
+    Returns:
+        str: Full commit SHA
+    """
+    git_dir = Path(repo_path) / '.git'
+
+    try:
+        head = (git_dir / 'HEAD').read_text().strip()
+
+        # Detached HEAD: the file holds the SHA itself
+        if not head.startswith('ref: '):
+            return head
+
+        ref = head[len('ref: '):]
+
+        # Loose ref file, e.g. .git/refs/heads/main
+        ref_file = git_dir / ref
+        if ref_file.is_file():
+            return ref_file.read_text().strip()
+
+        # Packed refs: lines of "<sha> <ref>"
+        with open(git_dir / 'packed-refs', 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+
+    except OSError:
+        pass
+
+    # Unusual layout - ask git
+    result = run_command(['git', 'rev-parse', 'HEAD'], cwd=repo_path, capture=True)
+    return result.stdout.strip()
+
+
 def run_command(cmd, cwd=None, capture=False):
     """
     Run a shell command
@@ -494,7 +924,8 @@ def update_yaml_files(config, repo_path, platform, app_variant, environment, bui
         build_id (str): Build identifier
 
     Returns:
-        list: List of files updated
+        tuple: (files_updated, old_app_id)
+               old_app_id is 'NOT_SET' if there was no previous app ID
     """
     print("📝 Updating YAML files...")
 
@@ -502,14 +933,72 @@ def update_yaml_files(config, repo_path, platform, app_variant, environment, bui
     files_updated = []
     timestamp = datetime.utcnow().isoformat() + 'Z'
 
-    # 1. Update app-specific YAML file
+    # 1. App-specific YAML file
     yaml_filename = get_yaml_filename(config, platform, app_variant)
-    yaml_file = repo / yaml_filename
 
+    app_data = {
+        'app_id': new_app_id,
+        'app_url': new_app_id,
+        'build_id': build_id,
+        'build_type': build_type,
+        'environment': environment,
+        'updated_at': timestamp
+    }
+
+    # Add version if provided
+    if version:
+        app_data['version'] = version
+
+    # 2. Update record for shared.yml
+    shared_record = {
+        'platform': platform,
+        'app_variant': app_variant,
+        'environment': environment,
+        'build_type': build_type,
+        'build_id': build_id,
+        'timestamp': timestamp
+    }
+
+    # The two files are independent, so update them at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        app_future = executor.submit(
+            update_app_yaml, repo / yaml_filename, app_variant, environment, build_type, app_data
+        )
+        shared_future = executor.submit(append_shared_update, repo / 'shared.yml', shared_record)
+
+        # Wait for both (re-raises any error)
+        old_app_id = app_future.result()
+        shared_future.result()
+
+    files_updated.append(yaml_filename)
+    print(f"✅ Updated: {yaml_filename}")
+
+    files_updated.append('shared.yml')
+    print(f"✅ Updated: shared.yml")
+
+    return files_updated, old_app_id
+
+
+def update_app_yaml(yaml_file, app_variant, environment, build_type, app_data):
+    """
+    Store new app data in an app-specific YAML file
+
+    Creates the nested structure if needed:
+        apps > app_variant > environment > build_type
+
+    Args:
+        yaml_file (Path): Path to the app YAML file
+        app_variant (str): agent, retail, or wallet
+        environment (str): production or staging
+        build_type (str): Debug or Release
+        app_data (dict): App ID and metadata to store
+
+    Returns:
+        str: App ID that was replaced, or 'NOT_SET' if there was none
+    """
     # Read existing content or create new
     if yaml_file.exists():
-        with open(yaml_file, 'r') as f:
-            content = yaml.safe_load(f) or {}
+        content = _cached_yaml_load(yaml_file) or {}
     else:
         content = {}
 
@@ -521,59 +1010,98 @@ def update_yaml_files(config, repo_path, platform, app_variant, environment, bui
     if environment not in content['apps'][app_variant]:
         content['apps'][app_variant][environment] = {}
 
-    # Update the app ID and metadata
-    app_data = {
-        'app_id': new_app_id,
-        'app_url': new_app_id,
-        'build_id': build_id,
-        'build_type': build_type,
-        'environment': environment,
-        'updated_at': timestamp
-    }
-
-    # Add version if provided
-    if version:
-        app_data['version'] = version
+    # Remember the previous app ID (for the Teams notification)
+    old_data = content['apps'][app_variant][environment].get(build_type)
+    old_app_id = 'NOT_SET'
+    if isinstance(old_data, dict) and old_data.get('app_id'):
+        old_app_id = old_data['app_id']
 
     content['apps'][app_variant][environment][build_type] = app_data
 
     # Write file back
     with open(yaml_file, 'w') as f:
-        yaml.dump(content, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(content, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
-    files_updated.append(yaml_filename)
-    print(f"✅ Updated: {yaml_filename}")
+    return old_app_id
 
-    # 2. Update shared.yml
-    shared_file = repo / 'shared.yml'
 
-    if shared_file.exists():
-        with open(shared_file, 'r') as f:
-            shared_content = yaml.safe_load(f) or {}
-    else:
-        shared_content = {}
+def append_shared_update(shared_file, record):
+    """
+    Add an update record to the 'updates' list in shared.yml
 
-    # Add update record
-    if 'updates' not in shared_content:
-        shared_content['updates'] = []
+    shared.yml only ever grows, so rewriting the whole file each run gets
+    slower over time. When 'updates' is the last section of the file (the
+    normal case), the new record is simply appended to the end of the file.
+    Otherwise the file is loaded, updated and written back in full.
 
-    shared_content['updates'].append({
-        'platform': platform,
-        'app_variant': app_variant,
-        'environment': environment,
-        'build_type': build_type,
-        'build_id': build_id,
-        'timestamp': timestamp
-    })
+    Args:
+        shared_file (Path): Path to shared.yml
+        record (dict): Update record to add
+    """
+    new_item = yaml.dump([record], Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+
+    # New file: write the 'updates' section with this first record
+    if not shared_file.exists():
+        with open(shared_file, 'w') as f:
+            f.write('updates:\n' + new_item)
+        return
+
+    with open(shared_file, 'r') as f:
+        text = f.read()
+
+    # Fast path: file ends with an 'updates:' block list - just append
+    top_level_keys = list(TOP_LEVEL_KEY_PATTERN.finditer(text))
+    if top_level_keys and top_level_keys[-1].group(1) == 'updates':
+        if UPDATES_LIST_PATTERN.match(text, top_level_keys[-1].start()):
+            with open(shared_file, 'a') as f:
+                if not text.endswith('\n'):
+                    f.write('\n')
+                f.write(new_item)
+            return
+
+    # Slow path: any other layout - load, update and rewrite the file
+    shared_content = _cached_yaml_load(shared_file) or {}
+    shared_content.setdefault('updates', []).append(record)
 
-    # Write shared file
     with open(shared_file, 'w') as f:
-        yaml.dump(shared_content, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(shared_content, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
-    files_updated.append('shared.yml')
-    print(f"✅ Updated: shared.yml")
 
-    return files_updated
+# Map full variant names to the abbreviations used in yaml_files
+VARIANT_ABBREVIATIONS = {
+    'agent': 'ag',
+    'retail': 're',
+    'wallet': 'ag'  # Default to ag
+}
+
+
+def build_yaml_filename_index(config):
+    """
+    Build a flat {(platform, app_variant): filename} lookup table
+
+    This is done once when the config is loaded, so get_yaml_filename is a
+    single dictionary lookup.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        dict: (platform, app_variant) -> YAML filename
+    """
+    index = {}
+    yaml_files = config.get('yaml_structure', {}).get('yaml_files') or {}
+
+    for platform, files in yaml_files.items():
+        # Keys used directly (e.g. 'ag', 're')
+        for key, filename in files.items():
+            index[(platform, key)] = filename
+
+        # Full variant names mapped to their abbreviation
+        for app_variant, abbreviation in VARIANT_ABBREVIATIONS.items():
+            if abbreviation in files:
+                index[(platform, app_variant)] = files[abbreviation]
+
+    return index
 
 
 def get_yaml_filename(config, platform, app_variant):
@@ -588,28 +1116,64 @@ def get_yaml_filename(config, platform, app_variant):
     Returns:
         str: Filename (e.g., 'browserstack_ag_Android.yml')
     """
-    yaml_files = config['yaml_structure']['yaml_files']
+    index = config.get('_yaml_filename_index')
+    if index is None:
+        # Config wasn't created by load_config - build the table now
+        index = config['_yaml_filename_index'] = build_yaml_filename_index(config)
 
-    # Map full variant names to abbreviations
-    variant_map = {
-        'agent': 'ag',
-        'retail': 're',
-        'wallet': 'ag'  # Default to ag
-    }
-
-    variant_key = variant_map.get(app_variant, app_variant)
-
-    if platform in yaml_files and variant_key in yaml_files[platform]:
-        return yaml_files[platform][variant_key]
-    else:
-        # Fallback
-        return f"{platform}_{app_variant}.yml"
+    # Fallback to default naming
+    return index.get((platform, app_variant), f"{platform}_{app_variant}.yml")
 
 
 # =============================================================================
 # 6. GITHUB API OPERATIONS
 # =============================================================================
 
+def build_pr_body(platform, app_variant, environment, build_type, build_id, version, new_app_id, files_updated, source_build_url):
+    """
+    Build the Markdown description for the Pull Request
+
+    The whole body is one f-string, so it is built in a single step.
+
+    Args:
+        platform (str): android, android_hw, or ios
+        app_variant (str): agent, retail, or wallet
+        environment (str): production or staging
+        build_type (str): Debug or Release
+        build_id (str): Build identifier
+        version (str): App version (optional)
+        new_app_id (str): New BrowserStack app ID
+        files_updated (list): Files changed in the commit
+        source_build_url (str): Source build URL
+
+    Returns:
+        str: PR description
+    """
+    version_line = f"\n- **Version**: {version}" if version else ''
+    file_lines = ''.join(f"- {file}\n" for file in files_updated)
+
+    return f"""## BrowserStack App Update
+
+### Build Information
+- **Platform**: {platform}
+- **Application**: {app_variant}
+- **Environment**: {environment}
+- **Build Type**: {build_type}
+- **Build ID**: {build_id}{version_line}
+
+### App ID Change
+- **New App ID**: {new_app_id}
+
+### Files Updated
+{file_lines}
+### Links
+- [Source Build]({source_build_url})
+- [BrowserStack Dashboard](https://app-live.browserstack.com)
+
+**Auto-generated by Simple Uploader**
+"""
+
+
 def create_pull_request(config, title, body, branch):
     """
     Create a Pull Request on GitHub
@@ -653,7 +1217,7 @@ def create_pull_request(config, title, body, branch):
 
     try:
         # Send POST request
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
         response.raise_for_status()
 
         # Parse response
@@ -749,7 +1313,7 @@ def send_teams_notification(config, platform, app_variant, environment, build_ty
 
     try:
         # Send to Teams
-        response = requests.post(webhook_url, json=card, timeout=10)
+        response = _session.post(webhook_url, json=card, timeout=10)
         response.raise_for_status()
 
         print("✅ Teams notification sent!")
@@ -780,6 +1344,15 @@ def run_upload_workflow(params, config_file='config/config.yaml'):
     print("="*70 + "\n")
 
     try:
+        # Parameters used in several steps
+        platform = params['platform']
+        app_variant = params['app_variant']
+        environment = params['environment']
+        build_type = params['build_type']
+        build_id = params['build_id']
+        version = params.get('version')
+        source_build_url = params['source_build_url']
+
         # STEP 1: Load Configuration
         print("📋 STEP 1: Load Configuration")
         print("-" * 70)
@@ -791,72 +1364,57 @@ def run_upload_workflow(params, config_file='config/config.yaml'):
         print("-" * 70)
         artifact_path = build_artifact_path(
             config,
-            params['platform'],
-            params['environment'],
-            params['build_type'],
-            params['app_variant'],
+            platform,
+            environment,
+            build_type,
+            app_variant,
             params.get('src_folder')
         )
 
         artifact_info = validate_artifact_file(artifact_path)
         print()
 
-        # STEP 3: Upload to BrowserStack
+        # STEPS 3-5: Upload to BrowserStack and prepare the Git repository
+        # These don't depend on each other (different servers), so they run
+        # at the same time. Their output may be mixed together.
         print("☁️  STEP 3: Upload to BrowserStack")
-        print("-" * 70)
-        custom_id = f"{params['platform']}-{params['app_variant']}-{params['environment']}-{params['build_type']}-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
-
-        upload_result = upload_to_browserstack(config, artifact_path, custom_id)
-        print()
-
-        # STEP 4: Clone Repository
         print("📦 STEP 4: Clone Git Repository")
-        print("-" * 70)
-        repo_path = clone_git_repo(config)
-        print()
-
-        # STEP 5: Setup Git Branch
         print("🌿 STEP 5: Setup Git Branch")
         print("-" * 70)
+        custom_id = f"{platform}-{app_variant}-{environment}-{build_type}-{time.strftime('%Y%m%d%H%M%S', time.gmtime())}"
 
-        # Check if we should create a PR or commit directly
-        create_pr = config['git'].get('create_pr', True)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            upload_future = executor.submit(upload_to_browserstack, config, artifact_path, custom_id)
+            repo_future = executor.submit(prepare_git_repo, config, params)
 
-        if create_pr:
-            # Create feature branch for PR
-            branch_name = f"browserstack-update/{params['platform']}/{params['app_variant']}/{params['build_id']}"
-            create_git_branch(repo_path, branch_name)
-            print(f"📝 Will create Pull Request from: {branch_name}")
-        else:
-            # Commit directly to target branch
-            branch_name = config['git'].get('target_branch', 'main')
-            checkout_existing_branch(repo_path, branch_name)
-            print(f"📝 Will commit directly to: {branch_name}")
+            # Wait for both to finish
+            upload_result = upload_future.result()
+            repo_path, branch_name, create_pr = repo_future.result()
 
         print()
 
         # STEP 6: Update YAML Files
         print("📝 STEP 6: Update YAML Files")
         print("-" * 70)
-        files_updated = update_yaml_files(
+        files_updated, old_app_id = update_yaml_files(
             config,
             repo_path,
-            params['platform'],
-            params['app_variant'],
-            params['environment'],
-            params['build_type'],
+            platform,
+            app_variant,
+            environment,
+            build_type,
             upload_result['app_id'],
-            params.get('version'),
-            params['build_id']
+            version,
+            build_id
         )
         print()
 
         # STEP 7: Commit & Push
         print("💾 STEP 7: Commit & Push Changes")
         print("-" * 70)
-        commit_message = f"Update BrowserStack app ID for {params['platform']}/{params['app_variant']} {params['environment']} {params['build_type']}\n\nBuild: {params['build_id']}"
-        if params.get('version'):
-            commit_message += f"\nVersion: {params['version']}"
+        commit_message = f"Update BrowserStack app ID for {platform}/{app_variant} {environment} {build_type}\n\nBuild: {build_id}"
+        if version:
+            commit_message += f"\nVersion: {version}"
 
         commit_sha = commit_and_push(repo_path, branch_name, files_updated, commit_message)
         print()
@@ -866,37 +1424,19 @@ def run_upload_workflow(params, config_file='config/config.yaml'):
         if create_pr:
             print("🔀 STEP 8: Create Pull Request")
             print("-" * 70)
-            pr_title = f"[BrowserStack] Update {params['app_variant']}: {params['platform']} {params['environment']} {params['build_type']}"
-
-            pr_body = f"""## BrowserStack App Update
-
-### Build Information
-- **Platform**: {params['platform']}
-- **Application**: {params['app_variant']}
-- **Environment**: {params['environment']}
-- **Build Type**: {params['build_type']}
-- **Build ID**: {params['build_id']}"""
-
-            if params.get('version'):
-                pr_body += f"\n- **Version**: {params['version']}"
-
-            pr_body += f"""
-
-### App ID Change
-- **New App ID**: {upload_result['app_id']}
-
-### Files Updated
-"""
-            for file in files_updated:
-                pr_body += f"- {file}\n"
-
-            pr_body += f"""
-### Links
-- [Source Build]({params['source_build_url']})
-- [BrowserStack Dashboard](https://app-live.browserstack.com)
-
-**Auto-generated by Simple Uploader**
-"""
+            pr_title = f"[BrowserStack] Update {app_variant}: {platform} {environment} {build_type}"
+
+            pr_body = build_pr_body(
+                platform,
+                app_variant,
+                environment,
+                build_type,
+                build_id,
+                version,
+                upload_result['app_id'],
+                files_updated,
+                source_build_url
+            )
 
             pr_url = create_pull_request(config, pr_title, pr_body, branch_name)
             print()
@@ -912,19 +1452,19 @@ def run_upload_workflow(params, config_file='config/config.yaml'):
         print("-" * 70)
 
         # For Teams notification, use a placeholder if no PR was created
-        teams_pr_url = pr_url if pr_url else params['source_build_url']
+        teams_pr_url = pr_url if pr_url else source_build_url
 
         send_teams_notification(
             config,
-            params['platform'],
-            params['app_variant'],
-            params['environment'],
-            params['build_type'],
-            params.get('version'),
-            'NOT_SET',  # We don't read old ID in simple version
+            platform,
+            app_variant,
+            environment,
+            build_type,
+            version,
+            old_app_id,  # Read while updating the YAML file in step 6
             upload_result['app_id'],
             teams_pr_url,
-            params['source_build_url']
+            source_build_url
         )
         print()
 
@@ -933,6 +1473,7 @@ def run_upload_workflow(params, config_file='config/config.yaml'):
         print("✅ WORKFLOW COMPLETED SUCCESSFULLY!")
         print("="*70)
         print(f"📱 App ID: {upload_result['app_id']}")
+        print(f"🔐 SHA-256: {upload_result['sha256']}")
         print(f"🌿 Branch: {branch_name}")
         print(f"📝 Commit: {commit_sha[:8]}")
         if pr_url:
@@ -944,6 +1485,8 @@ def run_upload_workflow(params, config_file='config/config.yaml'):
         result = {
             'status': 'SUCCESS',
             'app_id': upload_result['app_id'],
+            'md5': upload_result['md5'],
+            'sha256': upload_result['sha256'],
             'branch': branch_name,
             'commit_sha': commit_sha
         }
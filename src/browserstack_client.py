@@ -9,14 +9,203 @@ Key Concepts:
 - HTTP requests: Communicating with BrowserStack API
 - File upload: Sending binary file data to server
 - Retry logic: Automatically retrying on network failures
+- Rate limiting: Honouring Retry-After and an optional requests-per-minute cap
 - Authentication: Using username and access key
+- Batch upload: Uploading several artifacts at once over one session
 """
 
+import hashlib
+import os
 import requests
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from logger import get_logger
+from utils import retry_with_backoff
 from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
 from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
+
+# Use orjson to parse API responses when it is installed (much faster)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Bytes sent per socket write when streaming a request body (urllib3's
+# default is 16KB; larger blocks mean fewer read/encrypt/send calls)
+UPLOAD_BLOCK_SIZE = 64 * 1024
+
+# Status codes worth retrying (rate limited or server-side failures)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after(value):
+    """
+    Convert a Retry-After header to seconds
+
+    Args:
+        value (str): Header value, either seconds or an HTTP date
+
+    Returns:
+        float or None: Seconds to wait (never negative), None if missing or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryableHTTPError(requests.exceptions.HTTPError):
+    """
+    HTTP error with a status worth retrying (see RETRY_STATUS_CODES)
+
+    retry_after holds the server's Retry-After delay in seconds (None if
+    the response had no usable Retry-After header).
+    """
+
+    def __init__(self, *args, retry_after=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
+
+
+class HashingReader:
+    """
+    File wrapper that calculates checksums while the file is read
+
+    The multipart encoder reads the artifact through this wrapper, so the
+    checksums come out of the upload itself and the file is read only once.
+    MD5 is kept for existing consumers; SHA-256 is the stronger digest and
+    uses the CPU's SHA instructions through OpenSSL where available.
+    """
+
+    def __init__(self, f, algorithms=('md5', 'sha256')):
+        self.f = f
+        self.hashes = {name: hashlib.new(name) for name in algorithms}
+
+    def read(self, size=-1):
+        """Read from the file and feed the bytes into every hash"""
+        chunk = self.f.read(size)
+        for hash_obj in self.hashes.values():
+            hash_obj.update(chunk)
+        return chunk
+
+    def fileno(self):
+        """File descriptor of the wrapped file (used to find its size)"""
+        return self.f.fileno()
+
+    def tell(self):
+        """Current read position in the wrapped file"""
+        return self.f.tell()
+
+    def hexdigests(self):
+        """Return {algorithm: hex digest} for everything read so far"""
+        return {name: hash_obj.hexdigest() for name, hash_obj in self.hashes.items()}
+
+
+class BrowserStackHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that streams request bodies in large blocks
+
+    Every connection it creates reads and sends the upload body in
+    UPLOAD_BLOCK_SIZE pieces, which matters for 100MB+ artifacts.
+
+    HTTPS connections also share one SSL context per CA bundle, so the
+    bundle (often a large corporate one, e.g. from REQUESTS_CA_BUNDLE) is
+    parsed once instead of for every new connection. The context is built
+    the same way urllib3 builds its own, so certificate checks don't change.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            **kwargs: Passed to HTTPAdapter (max_retries, pool sizes, ...)
+        """
+        # SSL contexts by CA bundle path, created on first use
+        self._ssl_contexts = {}
+        super().__init__(**kwargs)
+
+    def _get_ssl_context(self, url, verify):
+        """
+        Get the shared SSL context for a request
+
+        Args:
+            url (str): Request URL
+            verify: requests' verify setting (True, False or CA bundle path)
+
+        Returns:
+            ssl.SSLContext or None: None to keep requests' default handling
+        """
+        if verify is False or not url.lower().startswith('https'):
+            return None
+
+        ca_path = DEFAULT_CA_BUNDLE_PATH if verify is True else verify
+        context = self._ssl_contexts.get(ca_path)
+
+        if context is None:
+            # Missing bundle: let requests raise its usual error
+            if not ca_path or not os.path.exists(ca_path):
+                return None
+
+            try:
+                context = create_urllib3_context()
+                if os.path.isdir(ca_path):
+                    context.load_verify_locations(capath=ca_path)
+                else:
+                    context.load_verify_locations(cafile=ca_path)
+            except OSError:
+                # Unreadable bundle (ssl.SSLError is an OSError): let
+                # requests raise its usual SSLError
+                return None
+            self._ssl_contexts[ca_path] = context
+
+        return context
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        """Select the connection pool, adding the shared SSL context"""
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        context = self._get_ssl_context(request.url, verify)
+        if context is not None:
+            pool_kwargs['ssl_context'] = context
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        """Set certificate options, without reloading the CA bundle per connection"""
+        super().cert_verify(conn, url, verify, cert)
+        context = self._get_ssl_context(url, verify)
+        # Only for pools that really use the shared context (requests before
+        # 2.32 never calls build_connection_pool_key_attributes)
+        if context is not None and getattr(conn, 'conn_kw', {}).get('ssl_context') is context:
+            # The shared context already trusts the bundle
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        """Create the connection pool manager with the larger block size"""
+        pool_kwargs.setdefault('blocksize', UPLOAD_BLOCK_SIZE)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        """Create proxy pool managers with the larger block size too"""
+        proxy_kwargs.setdefault('blocksize', UPLOAD_BLOCK_SIZE)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
 
 
 class BrowserStackClient:
@@ -24,7 +213,7 @@ class BrowserStackClient:
     Client for BrowserStack App Automate API
 
     This class handles:
-    - Uploading app artifacts to BrowserStack
+    - Uploading app artifacts to BrowserStack (one at a time or in batches)
     - Retrieving app details
     - Deleting apps from BrowserStack
     """
@@ -40,20 +229,31 @@ class BrowserStackClient:
         self.log = get_logger(__name__)
 
         # Get BrowserStack configuration
-        bs_config = config.get_browserstack_config()
+        bs_config = config.browserstack
 
         # Store credentials
-        self.username = bs_config['username']
-        self.access_key = bs_config['access_key']
-        self.api_endpoint = bs_config.get(
-            'api_endpoint',
-            'https://api-cloud.browserstack.com/app-automate/upload'
-        )
-        self.upload_timeout = bs_config.get('upload_timeout', 300)
+        self.username = bs_config.username
+        self.access_key = bs_config.access_key
+        self.api_endpoint = bs_config.api_endpoint
+        self.upload_timeout = bs_config.upload_timeout
+
+        # Optional client-side rate limit (sliding 60 second window)
+        self.max_requests_per_minute = bs_config.max_requests_per_minute
+        self._request_times = deque()
+        self._rate_lock = threading.Lock()
 
         # Create HTTP session with retry logic
         self.session = self._create_session()
 
+        # Upload request template: URL, auth header and environment settings
+        # (proxies, CA bundle) are resolved once and reused for every upload
+        self._upload_request = self.session.prepare_request(requests.Request(
+            'POST', self.api_endpoint, auth=(self.username, self.access_key)
+        ))
+        self._upload_settings = self.session.merge_environment_settings(
+            self._upload_request.url, {}, None, None, None
+        )
+
     def _create_session(self):
         """
         Create HTTP session with automatic retry logic
@@ -63,7 +263,18 @@ class BrowserStackClient:
         - Server returns 500, 502, 503, 504 (Server Errors)
         - Network errors occur
 
-        Uses exponential backoff: 1s -> 2s -> 4s -> etc.
+        Only GET and DELETE are retried here. Uploads stream their body from
+        the file, and a stream can't be sent twice, so upload_app() retries
+        POSTs itself with a fresh body for every attempt (also waiting for
+        the Retry-After delay).
+
+        Uses exponential backoff: 1s -> 2s -> 4s -> etc. When the server
+        sends a Retry-After header (usually with 429), urllib3 uses that
+        delay instead, so we neither retry too early nor sleep longer than
+        needed.
+
+        The session keeps HTTPS connections alive, so only the first request
+        pays for the TLS handshake.
 
         Returns:
             requests.Session: Configured session with retry strategy
@@ -72,18 +283,25 @@ class BrowserStackClient:
         session = requests.Session()
 
         # Get retry configuration
-        retry_config = self.config.get_retry_config()
+        retry_config = self.config.retry
 
         # Setup retry strategy
         retry_strategy = Retry(
-            total=retry_config['max_attempts'],  # Max 3 attempts
-            backoff_factor=retry_config['backoff_factor'],  # Exponential backoff
-            status_forcelist=[429, 500, 502, 503, 504],  # Retry on these codes
-            allowed_methods=['POST', 'GET']  # Retry these methods
+            total=retry_config.max_attempts,  # Max 3 attempts
+            backoff_factor=retry_config.backoff_factor,  # Exponential backoff
+            status_forcelist=RETRY_STATUS_CODES,  # Retry on these codes
+            allowed_methods=['GET', 'DELETE']  # Retry these methods
         )
 
-        # Create adapter with retry strategy
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Create adapter with retry strategy. Connections are kept alive and
+        # reused by upload/get/delete; the pool is large enough for
+        # upload_apps() so parallel uploads never open throwaway connections.
+        adapter = BrowserStackHTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=4,  # Distinct hosts kept in the pool
+            pool_maxsize=8,  # Connections kept alive per host
+            pool_block=False
+        )
 
         # Mount adapter for both HTTP and HTTPS
         session.mount('https://', adapter)
@@ -91,15 +309,44 @@ class BrowserStackClient:
 
         return session
 
+    def _wait_if_throttled(self):
+        """
+        Block until another request fits in the requests-per-minute limit
+
+        Keeps the send times of the last minute in a deque; when the limit
+        is reached, sleeps until the oldest one is 60 seconds old. Does
+        nothing when max_requests_per_minute is not configured.
+        """
+        if not self.max_requests_per_minute:
+            return
+
+        with self._rate_lock:
+            while True:
+                now = time.monotonic()
+
+                # Forget requests that left the 60 second window
+                while self._request_times and now - self._request_times[0] >= 60:
+                    self._request_times.popleft()
+
+                if len(self._request_times) < self.max_requests_per_minute:
+                    self._request_times.append(now)
+                    return
+
+                wait = 60 - (now - self._request_times[0])
+                self.log.debug(f"Rate limit reached, waiting {wait:.1f}s")
+                time.sleep(wait)
+
     def upload_app(self, artifact_path, custom_id, app_variant=None, environment=None):
         """
         Upload app artifact to BrowserStack
 
         Process:
         1. Open app file in binary mode
-        2. Send to BrowserStack API with authentication
+        2. Stream it to BrowserStack API with authentication
+           (multipart body is encoded on the fly, never held in memory)
         3. Parse response JSON
-        4. Return app URL and metadata
+        4. Return app URL and metadata (including the file's MD5 and SHA-256,
+           calculated from the bytes as they were sent)
 
         Args:
             artifact_path (str): Path to APK/IPA file
@@ -108,7 +355,8 @@ class BrowserStackClient:
             environment (str): Environment name (optional, for logging)
 
         Returns:
-            dict: Upload result with app_id, custom_id, timestamp, response
+            dict: Upload result with app_id, custom_id, md5, sha256, timestamp,
+                response
 
         Raises:
             requests.exceptions.Timeout: If upload takes too long
@@ -117,54 +365,33 @@ class BrowserStackClient:
         """
         self.log.info(f"Uploading artifact to BrowserStack: {artifact_path}")
 
-        try:
-            # Open file in binary read mode
-            with open(artifact_path, 'rb') as f:
-                files = {'file': f}  # File data to upload
-                data = {'custom_id': custom_id}  # Additional metadata
-
-                # Log upload details
-                self.log.debug(f"Custom ID: {custom_id}")
-                self.log.debug(f"Endpoint: {self.api_endpoint}")
-                if app_variant:
-                    self.log.debug(f"App Variant: {app_variant}")
-                if environment:
-                    self.log.debug(f"Environment: {environment}")
-
-                # Send POST request to BrowserStack API
-                response = self.session.post(
-                    self.api_endpoint,
-                    files=files,
-                    data=data,
-                    auth=(self.username, self.access_key),  # Basic auth
-                    timeout=self.upload_timeout  # 5 minute timeout
-                )
-
-                # Raise error if HTTP status is not 2xx
-                response.raise_for_status()
+        # Log upload details
+        self.log.debug(f"Custom ID: {custom_id}")
+        self.log.debug(f"Endpoint: {self.api_endpoint}")
+        if app_variant:
+            self.log.debug(f"App Variant: {app_variant}")
+        if environment:
+            self.log.debug(f"Environment: {environment}")
 
-                # Parse JSON response
-                result = response.json()
-                self.log.debug(f"Response: {result}")
-
-                # Check if upload was successful (app_url should be in response)
-                if 'app_url' not in result:
-                    raise ValueError(
-                        f"Invalid BrowserStack response: {result}"
-                    )
-
-                # Extract app URL (this is the app ID)
-                app_id = result['app_url']
-                self.log.info(f"Upload successful: {app_id}")
-
-                # Return upload metadata
-                return {
-                    'app_id': app_id,
-                    'app_url': app_id,  # Alias for compatibility
-                    'custom_id': custom_id,
-                    'timestamp': time.time(),
-                    'response': result
-                }
+        retry_config = self.config.retry
+
+        try:
+            # Each attempt reopens the file and builds a new body, so a retry
+            # sends the whole file again and the checksums cover that attempt
+            return retry_with_backoff(
+                lambda: self._send_upload(artifact_path, custom_id),
+                max_attempts=retry_config.max_attempts,
+                initial_delay=retry_config.initial_delay,
+                backoff_factor=retry_config.backoff_factor,
+                retry_on=(
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    RetryableHTTPError
+                ),
+                max_total=None,  # Uploads can take minutes; rely on max_attempts
+                # Wait at least as long as a 429/503 Retry-After asks
+                delay_for=lambda e: getattr(e, 'retry_after', None)
+            )
 
         except requests.exceptions.Timeout:
             # Handle timeout error
@@ -181,6 +408,121 @@ class BrowserStackClient:
             self.log.error(f"Invalid response: {e}")
             raise
 
+    def _send_upload(self, artifact_path, custom_id):
+        """
+        Send one upload attempt to BrowserStack
+
+        Args:
+            artifact_path (str): Path to APK/IPA file
+            custom_id (str): Custom identifier for this upload
+
+        Returns:
+            dict: Upload result (see upload_app)
+
+        Raises:
+            RetryableHTTPError: If BrowserStack answers 429 or 5xx
+            requests.exceptions.RequestException: If HTTP request fails
+            ValueError: If BrowserStack response is invalid
+        """
+        # Imported here: only uploads need the multipart encoder
+        from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+        # Open file in binary read mode
+        with open(artifact_path, 'rb') as f:
+            # Multipart body: file data + metadata, read from disk in chunks
+            # (and hashed on the way)
+            reader = HashingReader(f)
+            encoder = MultipartEncoder(fields={
+                'custom_id': custom_id,
+                'file': (os.path.basename(artifact_path), reader, 'application/octet-stream')
+            })
+
+            self._wait_if_throttled()  # Optional requests-per-minute limit
+
+            # Send POST request to BrowserStack API (copy of the prepared
+            # template with this upload's body attached)
+            request = self._upload_request.copy()
+            request.prepare_body(encoder, None)
+            request.headers['Content-Type'] = encoder.content_type
+            response = self.session.send(
+                request,
+                timeout=self.upload_timeout,  # 5 minute timeout
+                **self._upload_settings
+            )
+
+        # Raise error if HTTP status is not 2xx
+        if response.status_code in RETRY_STATUS_CODES:
+            response.close()
+            raise RetryableHTTPError(
+                f"{response.status_code} Error: {response.reason} for url: {response.url}",
+                response=response,
+                retry_after=parse_retry_after(response.headers.get('Retry-After'))
+            )
+        response.raise_for_status()
+
+        # Parse JSON response, then hand the connection back to the pool
+        result = _json_loads(response.content)
+        response.close()
+        self.log.debug(f"Response: {result}")
+
+        # Check if upload was successful (app_url should be in response)
+        if 'app_url' not in result:
+            raise ValueError(
+                f"Invalid BrowserStack response: {result}"
+            )
+
+        # Extract app URL (this is the app ID)
+        app_id = result['app_url']
+        self.log.info(f"Upload successful: {app_id}")
+
+        # Return upload metadata
+        checksums = reader.hexdigests()
+        return {
+            'app_id': app_id,
+            'app_url': app_id,  # Alias for compatibility
+            'custom_id': custom_id,
+            'md5': checksums['md5'],
+            'sha256': checksums['sha256'],
+            'timestamp': time.time(),
+            'response': result
+        }
+
+    def upload_apps(self, uploads, max_workers=6):
+        """
+        Upload several app artifacts to BrowserStack concurrently
+
+        Uploads are network-bound, so they run in a small thread pool and
+        share this client's session (keep-alive connections and retries).
+
+        Example:
+            client.upload_apps([
+                {'artifact_path': 'app-release.apk', 'custom_id': 'android_prod'},
+                {'artifact_path': 'App.ipa', 'custom_id': 'ios_prod'},
+            ])
+
+        Args:
+            uploads (list): One dict of upload_app() arguments per artifact
+            max_workers (int): Maximum number of uploads running at once
+
+        Returns:
+            list: Upload results, in the same order as uploads
+
+        Raises:
+            requests.exceptions.RequestException: If any upload fails
+            ValueError: If any BrowserStack response is invalid
+        """
+        uploads = list(uploads)
+        if not uploads:
+            return []
+
+        self.log.info(f"Uploading {len(uploads)} artifacts to BrowserStack")
+
+        workers = min(max_workers, len(uploads))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.upload_app, **upload) for upload in uploads]
+            # result() re-raises the first failed upload (in input order)
+            return [future.result() for future in futures]
+
     def get_app_details(self, app_id):
         """
         Get details about an uploaded app
@@ -206,6 +548,8 @@ class BrowserStackClient:
             # Build endpoint URL
             endpoint = f"{self.api_endpoint}/{app_id_clean}"
 
+            self._wait_if_throttled()  # Optional requests-per-minute limit
+
             # Send GET request
             response = self.session.get(
                 endpoint,
@@ -214,7 +558,7 @@ class BrowserStackClient:
             )
 
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
 
         except Exception as e:
             self.log.error(f"Failed to fetch app details: {e}")
@@ -245,14 +589,18 @@ class BrowserStackClient:
             # Build endpoint URL
             endpoint = f"{self.api_endpoint}/{app_id_clean}"
 
-            # Send DELETE request
-            response = self.session.delete(
+            self._wait_if_throttled()  # Optional requests-per-minute limit
+
+            # Send DELETE request. Only the status code matters, so the
+            # response body is never downloaded (stream=True + close).
+            with self.session.delete(
                 endpoint,
                 auth=(self.username, self.access_key),
-                timeout=30
-            )
+                timeout=30,
+                stream=True
+            ) as response:
+                response.raise_for_status()
 
-            response.raise_for_status()
             self.log.info(f"App deleted: {app_id}")
             return True
 
@@ -8,11 +8,89 @@ It also replaces environment variables like ${BROWSERSTACK_USER} with their actu
 Key Concepts:
 - Config class: Manages all application settings
 - Environment variable substitution: Replaces ${VAR_NAME} with actual values
+- JSON cache: The parsed YAML is saved as config.yaml.json for faster startup
+- Settings sections: Read-only objects (config.browserstack.username, ...)
+  built once, the first time a section is used
 """
 
+import json
 import os
-import yaml
+import re
+import tempfile
+from dataclasses import asdict, dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import Optional
+
+# Marks a key that is missing from the configuration (cached by Config.get)
+_MISSING = object()
+
+# Matches ${VAR_NAME} placeholders anywhere inside a string value
+ENV_VAR_PATTERN = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserStackConfig:
+    """BrowserStack API settings"""
+    username: str
+    access_key: str
+    api_endpoint: str
+    upload_timeout: int
+    max_requests_per_minute: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class GitConfig:
+    """Git repository settings"""
+    repo_url: str
+    default_branch: str
+    user_name: str
+    user_email: str
+    create_pr: bool
+    target_branch: str
+    cache_dir: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class GitHubConfig:
+    """GitHub API settings"""
+    token: str
+    org: str
+    repo: str
+
+
+@dataclass(frozen=True, slots=True)
+class LocalStorageConfig:
+    """Local artifact storage settings"""
+    artifact_base_path: str
+    path_templates: dict
+    accepted_extensions: dict
+
+
+@dataclass(frozen=True, slots=True)
+class TeamsConfig:
+    """Microsoft Teams notification settings"""
+    webhook_url: str
+    mention_qa: bool
+    qa_group: str
+
+
+@dataclass(frozen=True, slots=True)
+class YAMLConfig:
+    """YAML file structure settings"""
+    shared_file: str
+    app_root_key: str
+    environment_levels: list
+    yaml_files: dict
+    emit_json_compatible: bool
+
+
+@dataclass(frozen=True, slots=True)
+class RetryConfig:
+    """Retry strategy settings"""
+    max_attempts: int
+    initial_delay: int
+    backoff_factor: int
 
 
 class Config:
@@ -23,6 +101,11 @@ class Config:
     1. Reads settings from a YAML file
     2. Replaces environment variable placeholders (${VAR_NAME})
     3. Provides methods to safely retrieve configuration values
+    4. Provides each section as a read-only object, e.g.:
+           config.browserstack.username
+           config.git.repo_url
+       A section is built the first time it is used, so a missing
+       required value only raises an error when that section is needed.
     """
 
     def __init__(self, config_path='config.yaml'):
@@ -42,21 +125,128 @@ class Config:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        # Read YAML file
-        with open(self.config_path, 'r') as f:
-            raw_config = yaml.safe_load(f)
+        # Read parsed configuration from the JSON cache, or from the YAML file
+        raw_config = self._load_raw_config()
 
         # Replace environment variables in configuration
         self.config = self._substitute_env_vars(raw_config)
 
+        # Results of get() by key - configuration never changes after loading
+        self._cache = {}
+
+    def _load_raw_config(self):
+        """
+        Load configuration before environment variables are replaced
+
+        The JSON cache (e.g. config.yaml.json) records the modification
+        time (in nanoseconds) and size of the YAML file it was made from, and
+        is only used when both still match exactly. Otherwise the YAML file is
+        parsed and the cache is rewritten. Environment variables are never
+        stored in the cache.
+
+        Returns:
+            dict: Parsed configuration
+        """
+        cache_path = Path(f"{self.config_path}.json")
+
+        # Taken before reading the YAML file, so a change made while it is
+        # being read leaves a stale stamp (and a cache miss next time)
+        source = self.config_path.stat()
+        stamp = {'mtime_ns': source.st_mtime_ns, 'size': source.st_size}
+
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if isinstance(cached, dict) and cached.get('source') == stamp:
+                return cached['config']
+        except (OSError, ValueError, KeyError):
+            # Missing or broken cache - fall back to the YAML file
+            pass
+
+        # Imported here: with an up-to-date JSON cache, YAML is not needed
+        import yaml
+
+        # Use the fast C (libyaml) loader when PyYAML was built with it
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        # Read YAML file
+        with open(self.config_path, 'r') as f:
+            raw_config = yaml.load(f, Loader=SafeLoader)
+
+        # JSON turns non-string keys into strings, so such a config would
+        # read back differently from the cache - don't cache it
+        if self._has_only_str_keys(raw_config):
+            self._write_cache(cache_path, {'source': stamp, 'config': raw_config})
+        return raw_config
+
+    @staticmethod
+    def _has_only_str_keys(data):
+        """
+        Check that every dictionary key in a parsed YAML tree is a string
+
+        Args:
+            data: Parsed configuration
+
+        Returns:
+            bool: True if the tree round-trips through JSON with the same keys
+        """
+        stack = [data]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, dict):
+                if not all(isinstance(key, str) for key in obj):
+                    return False
+                stack.extend(obj.values())
+            elif isinstance(obj, list):
+                stack.extend(obj)
+        return True
+
+    @staticmethod
+    def _write_cache(cache_path, data):
+        """
+        Save parsed configuration as JSON (best effort)
+
+        Writes to a temporary file and renames it, so a concurrent run never
+        reads a half-written cache. The file is created readable by its owner
+        only (0600), because the configuration may hold literal tokens.
+        Errors are ignored because the cache is only an optimization.
+
+        Args:
+            cache_path (Path): Where to write the JSON cache
+            data: Cache contents (source stamp and parsed configuration)
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix='.tmp'
+            )
+            with open(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
     def _substitute_env_vars(self, obj):
         """
-        Recursively replace environment variable placeholders with actual values
+        Replace environment variable placeholders with actual values
 
-        This function handles:
-        - Dictionaries: processes all key-value pairs
-        - Lists: processes all items
-        - Strings: replaces ${VAR_NAME} with environment variable values
+        Walks the configuration tree with an explicit stack and updates
+        dictionaries and lists in place:
+        - Dictionaries and lists: nested containers are pushed on the stack
+        - Strings: ${VAR_NAME} is replaced with the environment variable value
+          (one compiled regex pass; placeholders may be embedded in text)
+        - Other types: left untouched
+
+        Only strings that contain a placeholder are rewritten, so the rest of
+        the tree is not copied. The raw config is always a freshly parsed
+        tree, which makes updating it in place safe.
 
         Args:
             obj: Object to process (dict, list, string, or other)
@@ -64,30 +254,47 @@ class Config:
         Returns:
             Object with environment variables replaced
         """
-        if isinstance(obj, dict):
-            # For dictionaries: process all key-value pairs
-            return {k: self._substitute_env_vars(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            # For lists: process all items
-            return [self._substitute_env_vars(item) for item in obj]
-        elif isinstance(obj, str):
-            # For strings: replace ${VAR_NAME} with environment variable value
-            if obj.startswith('${') and obj.endswith('}'):
-                # Extract variable name (remove ${ and })
-                var_name = obj[2:-1]
-
-                # Get environment variable value
-                value = os.getenv(var_name)
-
-                # Raise error if environment variable not set
-                if value is None:
-                    raise ValueError(f"Environment variable not set: {var_name}")
+        if isinstance(obj, str):
+            if '${' not in obj:
+                return obj
+            return ENV_VAR_PATTERN.sub(self._env_var_value, obj)
+
+        stack = [obj]
+        while stack:
+            container = stack.pop()
+            if isinstance(container, dict):
+                items = container.items()
+            elif isinstance(container, list):
+                items = enumerate(container)
+            else:
+                continue
 
-                return value
-            return obj
-        else:
-            # For other types: return as-is
-            return obj
+            for key, value in items:
+                if isinstance(value, str):
+                    # Fast path - most values have no placeholders
+                    if '${' in value:
+                        container[key] = ENV_VAR_PATTERN.sub(self._env_var_value, value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+
+        return obj
+
+    @staticmethod
+    def _env_var_value(match):
+        """
+        Return the environment variable value for a ${VAR_NAME} match
+
+        Raises:
+            ValueError: If environment variable not set
+        """
+        var_name = match.group(1)
+        value = os.getenv(var_name)
+
+        # Raise error if environment variable not set
+        if value is None:
+            raise ValueError(f"Environment variable not set: {var_name}")
+
+        return value
 
     def get(self, key, default=None):
         """
@@ -104,20 +311,25 @@ class Config:
         Returns:
             Configuration value or default
         """
+        # Return the remembered result of an earlier lookup
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return default if value is None else value
+
         # Split key by dots to navigate nested dictionaries
-        keys = key.split('.')
         value = self.config
-
-        # Navigate through each level
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
-                    return default
+                    break
             else:
-                return default
+                value = None
+                break
 
-        return value
+        # Missing keys are remembered as None so the default still applies
+        self._cache[key] = value
+        return default if value is None else value
 
     def get_required(self, key):
         """
@@ -137,61 +349,106 @@ class Config:
             raise ValueError(f"Required configuration missing: {key}")
         return value
 
+    @cached_property
+    def browserstack(self):
+        """BrowserStack API settings"""
+        return BrowserStackConfig(
+            username=self.get_required('browserstack.username'),
+            access_key=self.get_required('browserstack.access_key'),
+            api_endpoint=self.get(
+                'browserstack.api_endpoint',
+                'https://api-cloud.browserstack.com/app-automate/upload'
+            ),
+            upload_timeout=self.get('browserstack.upload_timeout', 300),
+            max_requests_per_minute=self.get('browserstack.max_requests_per_minute')
+        )
+
+    @cached_property
+    def git(self):
+        """Git repository settings"""
+        return GitConfig(
+            repo_url=self.get_required('git.repo_url'),
+            default_branch=self.get('git.default_branch', 'main'),
+            user_name=self.get('git.user_name', 'DevOps Automation'),
+            user_email=self.get('git.user_email', 'devops@company.com'),
+            create_pr=self.get('git.create_pr', True),
+            target_branch=self.get('git.target_branch', 'main'),
+            cache_dir=self.get('git.cache_dir')
+        )
+
+    @cached_property
+    def github(self):
+        """GitHub API settings"""
+        return GitHubConfig(
+            token=self.get_required('github.token'),
+            org=self.get_required('github.org'),
+            repo=self.get_required('github.repo')
+        )
+
+    @cached_property
+    def local_storage(self):
+        """Local artifact storage settings"""
+        return LocalStorageConfig(
+            artifact_base_path=self.get_required('local_storage.artifact_base_path'),
+            path_templates=self.get_required('local_storage.path_templates'),
+            accepted_extensions=self.get_required('local_storage.accepted_extensions')
+        )
+
+    @cached_property
+    def teams(self):
+        """Microsoft Teams notification settings"""
+        return TeamsConfig(
+            webhook_url=self.get_required('notifications.teams.webhook_url'),
+            mention_qa=self.get('notifications.teams.mention_qa', True),
+            qa_group=self.get('notifications.teams.qa_group', 'QA Team')
+        )
+
+    @cached_property
+    def yaml_structure(self):
+        """YAML file structure settings"""
+        return YAMLConfig(
+            shared_file=self.get('yaml_structure.shared_file', 'shared.yml'),
+            app_root_key=self.get('yaml_structure.app_root_key', 'apps'),
+            environment_levels=self.get('yaml_structure.environment_levels', ['environment', 'build_type']),
+            yaml_files=self.get('yaml_structure.yaml_files', {}),
+            emit_json_compatible=self.get('yaml_structure.emit_json_compatible', False)
+        )
+
+    @cached_property
+    def retry(self):
+        """Retry strategy settings"""
+        return RetryConfig(
+            max_attempts=self.get('retry.max_attempts', 3),
+            initial_delay=self.get('retry.initial_delay', 2),
+            backoff_factor=self.get('retry.backoff_factor', 2)
+        )
+
+    # Dictionary versions of the sections above (kept for existing callers)
+
     def get_browserstack_config(self):
         """Get BrowserStack API configuration"""
-        return {
-            'username': self.get_required('browserstack.username'),
-            'access_key': self.get_required('browserstack.access_key'),
-            'api_endpoint': self.get('browserstack.api_endpoint'),
-            'upload_timeout': self.get('browserstack.upload_timeout', 300)
-        }
+        return asdict(self.browserstack)
 
     def get_git_config(self):
         """Get Git repository configuration"""
-        return {
-            'repo_url': self.get_required('git.repo_url'),
-            'default_branch': self.get('git.default_branch', 'main'),
-            'user_name': self.get('git.user_name', 'DevOps Automation'),
-            'user_email': self.get('git.user_email', 'devops@company.com'),
-            'create_pr': self.get('git.create_pr', True)
-        }
+        return asdict(self.git)
 
     def get_github_config(self):
         """Get GitHub API configuration"""
-        return {
-            'token': self.get_required('github.token'),
-            'org': self.get_required('github.org'),
-            'repo': self.get_required('github.repo')
-        }
+        return asdict(self.github)
 
     def get_local_storage_config(self):
         """Get local artifact storage configuration"""
-        return {
-            'artifact_base_path': self.get_required('local_storage.artifact_base_path'),
-            'path_templates': self.get_required('local_storage.path_templates'),
-            'accepted_extensions': self.get_required('local_storage.accepted_extensions')
-        }
+        return asdict(self.local_storage)
 
     def get_teams_config(self):
         """Get Microsoft Teams notification configuration"""
-        return {
-            'webhook_url': self.get_required('notifications.teams.webhook_url'),
-            'mention_qa': self.get('notifications.teams.mention_qa', True),
-            'qa_group': self.get('notifications.teams.qa_group', 'QA Team')
-        }
+        return asdict(self.teams)
 
     def get_yaml_config(self):
         """Get YAML file structure configuration"""
-        return {
-            'shared_file': self.get('yaml_structure.shared_file', 'shared.yml'),
-            'app_root_key': self.get('yaml_structure.app_root_key', 'apps'),
-            'environment_levels': self.get('yaml_structure.environment_levels', ['environment', 'build_type'])
-        }
+        return asdict(self.yaml_structure)
 
     def get_retry_config(self):
         """Get retry strategy configuration"""
-        return {
-            'max_attempts': self.get('retry.max_attempts', 3),
-            'initial_delay': self.get('retry.initial_delay', 2),
-            'backoff_factor': self.get('retry.backoff_factor', 2)
-        }
+        return asdict(self.retry)
@@ -15,18 +15,29 @@ Key Concepts:
 """
 
 import os
+import socket
+import stat
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from logger import get_logger
 
+# Module logger, shared by all instances
+log = get_logger(__name__)
+
+# SMB (Windows file sharing) port, used to probe UNC artifact shares
+SMB_PORT = 445
+
 
 class LocalStorage:
     """
     Manages local artifact storage operations
 
     Methods:
+    - probe(): Fail fast when a UNC artifact share is unreachable
     - construct_artifact_path(): Build file path from configuration
     - validate_artifact(): Verify file is valid and return metadata
+    - validate_artifacts(): Validate several artifacts in parallel
     """
 
     def __init__(self, config, src_folder=None):
@@ -38,10 +49,50 @@ class LocalStorage:
             src_folder: Optional custom source folder path (overrides config)
         """
         self.config = config
-        self.log = get_logger(__name__)
-        self.storage_config = config.get_local_storage_config()
+        self.storage_config = config.local_storage
         self.src_folder = src_folder
 
+        # Resolved once: path templates and the base folder they start from
+        # (custom src_folder if provided, otherwise config's artifact_base_path)
+        self._templates = self.storage_config.path_templates or {}
+        self._base_path = src_folder or self.storage_config.artifact_base_path
+
+        # Set once probe() has reached the file server
+        self._probed = False
+
+    def probe(self, timeout=2.0):
+        """
+        Check that the file server behind a UNC base path is reachable
+
+        For a UNC path (\\\\server\\share\\...) this opens a TCP connection to
+        the server's SMB port. An unreachable server then fails in about
+        `timeout` seconds instead of stalling the first file access for the
+        OS's SMB timeout. Local and mounted paths are not probed. A
+        successful probe is remembered for the lifetime of this object.
+
+        Args:
+            timeout (float): Connection timeout in seconds
+
+        Raises:
+            FileNotFoundError: If the file server cannot be reached
+        """
+        if self._probed:
+            return
+
+        base = str(self._base_path or '')
+        # Windows also accepts forward slashes; on POSIX //x is just /x
+        if base.startswith('\\\\') or (os.name == 'nt' and base.startswith('//')):
+            host = base[2:].replace('\\', '/').split('/', 1)[0]
+            try:
+                socket.create_connection((host, SMB_PORT), timeout=timeout).close()
+            except OSError as e:
+                raise FileNotFoundError(
+                    f"Artifact share not reachable: {host} ({e})"
+                ) from e
+            log.debug(f"File server reachable: {host}")
+
+        self._probed = True
+
     def construct_artifact_path(self, platform, environment, build_type, app_variant):
         """
         Construct the full path to an artifact file
@@ -63,44 +114,46 @@ class LocalStorage:
         Raises:
             ValueError: If platform not configured
         """
-        self.log.info(f"Constructing artifact path for {platform}/{app_variant}/{environment}/{build_type}")
+        log.info(f"Constructing artifact path for {platform}/{app_variant}/{environment}/{build_type}")
 
         # Get path template for this platform from config
-        templates = self.storage_config.get('path_templates', {})
-        template = templates.get(platform)
+        template = self._templates.get(platform)
 
         if not template:
             raise ValueError(f"No path template configured for platform: {platform}")
 
-        # Use custom src_folder if provided, otherwise use config's artifact_base_path
-        base_path = self.src_folder if self.src_folder else self.storage_config.get('artifact_base_path')
-
         # Replace placeholders in template
-        artifact_path = template.format(
-            base=base_path,
-            platform=platform,
-            environment=environment,
-            build_type=build_type,
-            build_type_lower=build_type.lower(),
-            app_variant=app_variant
-        )
-
-        self.log.debug(f"Constructed path: {artifact_path}")
+        artifact_path = template.format_map({
+            'base': self._base_path,
+            'platform': platform,
+            'environment': environment,
+            'build_type': build_type,
+            'build_type_lower': build_type.lower(),
+            'app_variant': app_variant
+        })
+
+        log.debug(f"Constructed path: {artifact_path}")
         return artifact_path
 
-    def validate_artifact(self, artifact_path):
+    def validate_artifact(self, artifact_path, platform=None, compute_md5=True):
         """
         Validate that artifact file exists and is valid
 
         Validation steps:
-        1. Check file exists
-        2. Check file is readable
-        3. Check file extension is allowed
-        4. Check file signature (magic bytes)
-        5. Calculate MD5 checksum
+        1. Check file exists and is a regular file (one stat call, which
+           matters on NFS where every stat is a network round trip)
+        2. Check file extension is allowed
+        3. Check file signature (magic bytes)
+        4. Calculate MD5 checksum
+        Steps 3 and 4 share one open file and one pass over its contents.
 
         Args:
             artifact_path (str): Path to artifact file
+            platform (str): Platform the path was built for (optional; guessed
+                from the path when not given)
+            compute_md5 (bool): Calculate the MD5 checksum (False skips reading
+                the whole file, e.g. when the upload calculates it; 'md5'
+                is then None)
 
         Returns:
             dict: Artifact metadata including size, MD5, extension, etc.
@@ -110,36 +163,47 @@ class LocalStorage:
             PermissionError: If file not readable
             ValueError: If file format invalid
         """
-        self.log.info(f"Validating artifact: {artifact_path}")
+        log.info(f"Validating artifact: {artifact_path}")
 
         path = Path(artifact_path)
+        suffix = path.suffix  # Computed once, used by several steps
 
-        # Step 1: Check file exists
-        if not path.exists():
+        # Step 1: Check file exists - a single stat gives type, size and mtime
+        try:
+            file_stat = os.stat(artifact_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Artifact not found: {artifact_path}")
 
-        # Step 2: Check file is readable
-        if not os.access(artifact_path, os.R_OK):
-            raise PermissionError(f"Artifact is not readable: {artifact_path}")
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise ValueError(f"Artifact is not a regular file: {artifact_path}")
 
-        # Step 3: Get file size and modification time
-        file_size = path.stat().st_size
-        file_mtime = path.stat().st_mtime
+        file_size = file_stat.st_size
+        file_mtime = file_stat.st_mtime
 
-        # Step 4: Validate file extension
-        valid_extensions = self._get_valid_extensions_for_file(artifact_path)
-        if path.suffix not in valid_extensions:
+        # Step 2: Validate file extension
+        if platform:
+            valid_extensions = self.storage_config.accepted_extensions.get(platform, [])
+        else:
+            valid_extensions = self._get_valid_extensions_for_file(artifact_path)
+        if suffix not in valid_extensions:
             raise ValueError(
-                f"Invalid artifact extension: {path.suffix}. "
+                f"Invalid artifact extension: {suffix}. "
                 f"Valid: {valid_extensions}"
             )
 
-        # Step 5: Calculate MD5 checksum
-        md5_checksum = self._calculate_md5(artifact_path)
+        # Open the file once (this also checks it is readable)
+        try:
+            f = open(artifact_path, 'rb')
+        except PermissionError:
+            raise PermissionError(f"Artifact is not readable: {artifact_path}")
+
+        with f:
+            # Step 3: Validate magic bytes (file signature)
+            magic_bytes = self._read_magic_bytes(f)
+            self._validate_magic_bytes(suffix, magic_bytes)
 
-        # Step 6: Validate magic bytes (file signature)
-        magic_bytes = self._read_magic_bytes(artifact_path)
-        self._validate_magic_bytes(path.suffix, magic_bytes)
+            # Step 4: Calculate MD5 checksum, continuing after the magic bytes
+            md5_checksum = self._calculate_md5(f, initial=magic_bytes) if compute_md5 else None
 
         # Build artifact info dictionary
         artifact_info = {
@@ -149,12 +213,44 @@ class LocalStorage:
             'size_mb': round(file_size / (1024 * 1024), 2),
             'md5': md5_checksum,
             'mtime': file_mtime,
-            'extension': path.suffix
+            'extension': suffix
         }
 
-        self.log.info(f"Artifact validated: {path.name} ({artifact_info['size_mb']}MB)")
+        log.info(f"Artifact validated: {path.name} ({artifact_info['size_mb']}MB)")
         return artifact_info
 
+    def validate_artifacts(self, artifact_paths, platform=None, max_workers=None):
+        """
+        Validate several artifact files in parallel
+
+        Hashing releases the GIL while it works on each chunk, so artifacts
+        are checked by a thread pool and use several CPU cores at once.
+
+        Args:
+            artifact_paths (list): Paths to artifact files
+            platform (str): Platform for all paths (optional, see validate_artifact)
+            max_workers (int): Maximum number of files checked at once
+                (defaults to the number of CPUs)
+
+        Returns:
+            list: Artifact metadata dicts, in the same order as artifact_paths
+
+        Raises:
+            FileNotFoundError, PermissionError, ValueError: As validate_artifact
+        """
+        artifact_paths = list(artifact_paths)
+        if not artifact_paths:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 4, len(artifact_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.validate_artifact, path, platform)
+                for path in artifact_paths
+            ]
+            # result() re-raises the first failed validation (in input order)
+            return [future.result() for future in futures]
+
     def _get_valid_extensions_for_file(self, artifact_path):
         """
         Get list of valid file extensions for a platform
@@ -165,60 +261,58 @@ class LocalStorage:
         Returns:
             list: Valid extensions (e.g., ['.apk', '.aab'])
         """
-        # Determine platform from path
-        if 'ios' in artifact_path:
+        # Determine platform from the path's folder names (both separators,
+        # so Windows paths work too)
+        parts = set(artifact_path.replace('\\', '/').split('/'))
+        if 'ios' in parts:
             platform = 'ios'
-        elif 'android_hw' in artifact_path or 'huawei' in artifact_path:
+        elif 'android_hw' in parts or 'huawei' in parts:
             platform = 'android_hw'
         else:
             platform = 'android'
 
         # Get valid extensions from config
-        extensions = self.storage_config.get('accepted_extensions', {}).get(platform, [])
+        extensions = self.storage_config.accepted_extensions.get(platform, [])
         return extensions
 
-    def _calculate_md5(self, file_path, chunk_size=8192):
+    def _calculate_md5(self, f, initial=b''):
         """
         Calculate MD5 checksum of file
 
-        We read file in chunks to handle large files efficiently.
+        hashlib.file_digest() reads the file in chunks and updates the hash
+        in C, so large files never go through a Python-level loop. Kernel
+        readahead keeps the next chunk loading while the current one is hashed.
 
         Args:
-            file_path (str): Path to file
-            chunk_size (int): Size of chunks to read (8KB default)
+            f: File opened in binary mode, positioned after `initial`
+            initial (bytes): Bytes already read from the start of the file
 
         Returns:
             str: MD5 hash in hexadecimal format
         """
-        # Create MD5 hash object
-        md5 = hashlib.md5()
-
-        # Read file in chunks and update hash
-        with open(file_path, 'rb') as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                md5.update(chunk)
+        # Tell the kernel we read front to back so it reads ahead further
+        # (Linux/Unix only; not available on Windows)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
 
-        # Return hexadecimal digest
-        return md5.hexdigest()
+        # MD5 hash object seeded with the bytes already read, then fed the
+        # rest of the file
+        return hashlib.file_digest(f, lambda: hashlib.md5(initial)).hexdigest()
 
-    def _read_magic_bytes(self, file_path, num_bytes=4):
+    def _read_magic_bytes(self, f, num_bytes=4):
         """
         Read first few bytes of file
 
         These bytes contain the file signature/magic bytes that identify file type.
 
         Args:
-            file_path (str): Path to file
+            f: File opened in binary mode, positioned at the start
             num_bytes (int): Number of bytes to read
 
         Returns:
             bytes: First bytes of file
         """
-        with open(file_path, 'rb') as f:
-            return f.read(num_bytes)
+        return f.read(num_bytes)
 
     def _validate_magic_bytes(self, extension, magic_bytes):
         """
@@ -251,4 +345,4 @@ class LocalStorage:
                     f"Expected ZIP signature (PK), got {magic_bytes[:2]}"
                 )
 
-        self.log.debug(f"Magic bytes validated for {extension}")
+        log.debug(f"Magic bytes validated for {extension}")
@@ -11,10 +11,17 @@ Key Features:
 - Timestamp for each log message
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 from pathlib import Path
 
+# Background thread that writes queued records to the log file
+_file_listener = None
+
 
 class ColoredFormatter(logging.Formatter):
     """
@@ -38,23 +45,87 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'  # Reset to default color
 
+    # Matches the levelname field in a format string, e.g. %(levelname)-8s
+    LEVELNAME_FIELD = re.compile(r'%\(levelname\)[-#0 +]*\d*s')
+
+    def __init__(self, fmt=None, datefmt=None, *args, **kwargs):
+        """
+        Build one plain formatter per log level with its color built in
+
+        Args:
+            fmt: Log format string (%-style)
+            datefmt: Date format string
+        """
+        super().__init__(fmt, datefmt, *args, **kwargs)
+
+        # Wrap the levelname field in each level's color once, up front
+        self._level_formatters = {
+            getattr(logging, level): logging.Formatter(
+                self.LEVELNAME_FIELD.sub(
+                    lambda m, color=color: f"{color}{m.group(0)}{self.RESET}",
+                    self._fmt
+                ),
+                datefmt
+            )
+            for level, color in self.COLORS.items()
+        }
+
     def format(self, record):
         """
         Format log record with color codes
 
+        The record itself is not changed, so other handlers (e.g. the log
+        file) still see the plain level name.
+
         Args:
             record: LogRecord object from Python logging
 
         Returns:
             Formatted log message with color
         """
-        # Add color codes to level name if color exists
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
+        formatter = self._level_formatters.get(record.levelno)
+        if formatter is None:
+            # Custom level without a color
+            return super().format(record)
+        return formatter.format(record)
 
-        # Format the message using parent class formatter
-        result = super().format(record)
-        return result
+
+class ConsoleHandler(logging.StreamHandler):
+    """
+    Stream handler that only flushes for important records
+
+    logging.StreamHandler flushes after every record, which is one write
+    system call per line. Here, records below flush_level (DEBUG by
+    default) stay in the stream's buffer and are written together with the
+    next INFO-or-higher record, so verbose runs write in batches while
+    normal progress messages still appear immediately. logging flushes all
+    handlers at exit, so nothing is lost.
+    """
+
+    def __init__(self, stream=None, flush_level=logging.INFO):
+        """
+        Args:
+            stream: Stream to write to (sys.stderr if not given)
+            flush_level: Lowest level that flushes the stream right away
+        """
+        super().__init__(stream)
+        self.flush_level = flush_level
+
+    def emit(self, record):
+        """
+        Write the formatted record, flushing only at flush_level and above
+
+        Args:
+            record: LogRecord object from Python logging
+        """
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logger(log_level=logging.INFO, log_file=None):
@@ -63,7 +134,8 @@ def setup_logger(log_level=logging.INFO, log_file=None):
 
     This function:
     1. Creates console handler with colored output
-    2. Creates file handler if log_file specified
+    2. Creates file handler if log_file specified (records are queued and
+       written by a background thread, so logging never waits on disk)
     3. Configures log format with timestamp
 
     Args:
@@ -73,6 +145,13 @@ def setup_logger(log_level=logging.INFO, log_file=None):
     Returns:
         Configured logger object
     """
+    # Skip collecting record fields our formats never show (thread, process,
+    # source file/line). See "Optimization" in the logging HOWTO.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     # Get the root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -80,9 +159,10 @@ def setup_logger(log_level=logging.INFO, log_file=None):
     # Remove any existing handlers to avoid duplicate logs
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_file_listener()
 
     # --- Setup Console Handler (with colors) ---
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = ConsoleHandler(sys.stdout)
     console_handler.setLevel(log_level)
 
     # Create colored formatter
@@ -109,11 +189,36 @@ def setup_logger(log_level=logging.INFO, log_file=None):
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+
+        # Loggers only put records on a queue; the listener thread does the
+        # actual file writes
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        root_logger.addHandler(queue_handler)
+
+        global _file_listener
+        _file_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
 
     return root_logger
 
 
+@atexit.register
+def _stop_file_listener():
+    """
+    Write any queued records to the log file and stop the listener thread
+    """
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
 def get_logger(name):
     """
     Get a logger for a specific module
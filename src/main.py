@@ -27,21 +27,16 @@ Usage:
 
 import argparse
 import sys
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, Any, Optional
 
 # Import our modules
 from config import Config
 from logger import setup_logger
 from local_storage import LocalStorage
-from browserstack_client import BrowserStackClient
-from yaml_updater import YAMLUpdater
-from github_client import GitHubClient
-from teams_notifier import TeamsNotifier
-from utils import validate_parameters, create_audit_trail
+from utils import validate_parameters, create_audit_trail, dumps_json, utc_now, utc_now_iso
 
 
 class BrowserStackUploader:
@@ -58,6 +53,9 @@ class BrowserStackUploader:
     7. Create Pull Request
     8. Send Teams Notification
     9. Create Audit Trail
+
+    Steps 3 and 4 are independent and run at the same time, and so are
+    steps 8 and 9.
     """
 
     def __init__(self, config_file: str, verbose: bool = False):
@@ -76,7 +74,12 @@ class BrowserStackUploader:
         self.logger = setup_logger(log_level)
         self.logger.info("BrowserStack Uploader initialized")
 
-    def run(self, params: Dict[str, str], output_file: Optional[str] = None) -> Dict[str, Any]:
+        # Background thread for writing the output file
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._output_future = None
+
+    def run(self, params: Dict[str, str], output_file: Optional[str] = None,
+            audit: Optional[bool] = None) -> Dict[str, Any]:
         """
         Execute the complete artifact upload workflow
 
@@ -91,6 +94,8 @@ class BrowserStackUploader:
                 - version: (optional) semantic version (X.Y.Z)
                 - src_folder: (optional) Custom source folder path for artifacts
             output_file (str): Optional JSON file for results
+            audit (bool): Write the audit trail file (None = audit.enabled
+                from config, default True)
 
         Returns:
             dict: Workflow results
@@ -99,7 +104,7 @@ class BrowserStackUploader:
             # Create result object
             result = {
                 "status": "PENDING",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_now_iso(),
                 "params": params,
                 "steps": {}
             }
@@ -146,6 +151,10 @@ class BrowserStackUploader:
                 self.logger.info(f"Using custom source folder: {src_folder}")
             local_storage = LocalStorage(self.config, src_folder=src_folder)
 
+            # Fail within seconds if the build share's server is down,
+            # rather than hanging on the first file access
+            local_storage.probe()
+
             # Build artifact path from parameters
             artifact_path = local_storage.construct_artifact_path(
                 platform=params['platform'],
@@ -154,56 +163,71 @@ class BrowserStackUploader:
                 app_variant=params['app_variant']
             )
 
-            # Validate artifact file
-            artifact_info = local_storage.validate_artifact(artifact_path)
+            # Validate artifact file. The MD5 is calculated during the upload
+            # (Step 3), so the file is only read once.
+            artifact_info = local_storage.validate_artifact(
+                artifact_path, platform=params['platform'], compute_md5=False
+            )
 
             self.logger.info(f"Artifact validated")
             self.logger.info(f"  Path: {artifact_info['path']}")
             self.logger.info(f"  Size: {artifact_info['size_mb']} MB")
-            self.logger.info(f"  MD5: {artifact_info['md5']}")
             result["steps"]["artifact_validation"] = "SUCCESS"
             result["artifact"] = artifact_info
 
             # =========================================================
-            # STEP 3: Upload to BrowserStack
+            # STEPS 3 & 4: Upload to BrowserStack + Clone YAML Repository
             # =========================================================
+            # The upload and the clone talk to different servers and don't
+            # depend on each other, so they run at the same time. Log lines
+            # from the two steps may be interleaved.
             self.logger.info("\n" + "=" * 70)
             self.logger.info("STEP 3: Upload to BrowserStack")
+            self.logger.info("STEP 4: Clone & Prepare YAML Repository")
             self.logger.info("=" * 70)
 
-            # Create BrowserStack client
+            # Imported here rather than at module level: they pull in
+            # requests and friends, which --help and invalid runs never need
+            from browserstack_client import BrowserStackClient
+            from github_client import GitHubClient
+            from yaml_updater import YAMLUpdater
+
+            # Create BrowserStack and GitHub clients
             bs_client = BrowserStackClient(self.config)
+            github = GitHubClient(self.config)
 
-            # Upload app
-            upload_result = bs_client.upload_app(
-                artifact_path=artifact_info['path'],
-                custom_id=self._generate_custom_id(params),
-                app_variant=params['app_variant'],
-                environment=params['environment']
-            )
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Upload app
+                upload_future = executor.submit(
+                    bs_client.upload_app,
+                    artifact_path=artifact_info['path'],
+                    custom_id=self._generate_custom_id(params),
+                    app_variant=params['app_variant'],
+                    environment=params['environment']
+                )
+
+                # Clone repo and create branch
+                repo_future = executor.submit(
+                    github.clone_and_prepare_branch,
+                    platform=params['platform'],
+                    app_variant=params['app_variant'],
+                    build_id=params['build_id']
+                )
+
+                # Wait for both (re-raises the first error)
+                upload_result = upload_future.result()
+                repo_info = repo_future.result()
+
+            artifact_info['md5'] = upload_result['md5']
+            artifact_info['sha256'] = upload_result['sha256']
 
             self.logger.info(f"Upload successful")
             self.logger.info(f"  App ID: {upload_result['app_id']}")
+            self.logger.info(f"  MD5: {artifact_info['md5']}")
+            self.logger.info(f"  SHA-256: {artifact_info['sha256']}")
             result["steps"]["browserstack_upload"] = "SUCCESS"
             result["browserstack"] = upload_result
 
-            # =========================================================
-            # STEP 4: Clone & Prepare YAML Repository
-            # =========================================================
-            self.logger.info("\n" + "=" * 70)
-            self.logger.info("STEP 4: Clone & Prepare YAML Repository")
-            self.logger.info("=" * 70)
-
-            # Create GitHub client
-            github = GitHubClient(self.config)
-
-            # Clone repo and create branch
-            repo_info = github.clone_and_prepare_branch(
-                platform=params['platform'],
-                app_variant=params['app_variant'],
-                build_id=params['build_id']
-            )
-
             self.logger.info(f"Repository prepared")
             self.logger.info(f"  Clone Path: {repo_info['clone_path']}")
             self.logger.info(f"  Branch: {repo_info['branch']}")
@@ -358,55 +382,83 @@ class BrowserStackUploader:
                 result["steps"]["create_pr"] = "SKIPPED"
 
             # =========================================================
-            # STEP 8: Send Teams Notification
+            # STEPS 8 & 9: Send Teams Notification + Create Audit Trail
             # =========================================================
+            # The notification (network) and the audit file (local disk)
+            # share no state, so they run at the same time.
             self.logger.info("\n" + "=" * 70)
             self.logger.info("STEP 8: Send Teams Notification")
-            self.logger.info("=" * 70)
-
-            notifier = TeamsNotifier(self.config)
-            notifier.send_notification(
-                platform=params['platform'],
-                app_variant=params['app_variant'],
-                environment=params['environment'],
-                build_type=params['build_type'],
-                version=params.get('version'),
-                old_app_id=old_app_id,
-                new_app_id=upload_result['app_id'],
-                pr_url=pr_url,  # Will be None if create_pr is False
-                source_build_url=params['source_build_url'],
-                yaml_file=f"{params['platform']}/{params['app_variant']}.yml"
-            )
-
-            self.logger.info(f"Teams notification sent")
-            result["steps"]["teams_notification"] = "SUCCESS"
-
-            # =========================================================
-            # STEP 9: Create Audit Trail
-            # =========================================================
-            self.logger.info("\n" + "=" * 70)
             self.logger.info("STEP 9: Create Audit Trail")
             self.logger.info("=" * 70)
 
-            audit_file = create_audit_trail(
-                params=params,
-                artifact_info=artifact_info,
-                upload_result=upload_result,
-                old_app_id=old_app_id,
-                pr_info=pr_info,  # Will be None if create_pr is False
-                yaml_files=yaml_files_updated
-            )
-
-            self.logger.info(f"Audit trail created")
-            self.logger.info(f"  File: {audit_file}")
-            result["steps"]["audit_trail"] = "SUCCESS"
-            result["audit_file"] = audit_file
+            # No webhook (common in dev setups): skip without building the card
+            notify = bool(self.config.get('notifications.teams.webhook_url'))
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Send Teams notification
+                notify_future = None
+                if notify:
+                    from teams_notifier import TeamsNotifier
+                    notifier = TeamsNotifier(self.config)
+                    notify_future = executor.submit(
+                        notifier.send_notification,
+                        platform=params['platform'],
+                        app_variant=params['app_variant'],
+                        environment=params['environment'],
+                        build_type=params['build_type'],
+                        version=params.get('version'),
+                        old_app_id=old_app_id,
+                        new_app_id=upload_result['app_id'],
+                        pr_url=pr_url,  # Will be None if create_pr is False
+                        source_build_url=params['source_build_url'],
+                        yaml_file=f"{params['platform']}/{params['app_variant']}.yml"
+                    )
+
+                # Create audit trail (unless disabled)
+                if audit is None:
+                    audit = self.config.get('audit.enabled', True)
+                audit_future = None
+                if audit:
+                    audit_future = executor.submit(
+                        create_audit_trail,
+                        params=params,
+                        artifact_info=artifact_info,
+                        upload_result=upload_result,
+                        old_app_id=old_app_id,
+                        pr_info=pr_info,  # Will be None if create_pr is False
+                        yaml_files=yaml_files_updated
+                    )
+
+                # Wait for both (re-raises the first error)
+                if notify_future:
+                    notify_future.result()
+                audit_file = audit_future.result() if audit_future else None
+
+            if notify:
+                self.logger.info(f"Teams notification sent")
+                result["steps"]["teams_notification"] = "SUCCESS"
+            else:
+                self.logger.info(f"Teams webhook not configured - skipping")
+                result["steps"]["teams_notification"] = "SKIPPED"
+
+            if audit_file:
+                self.logger.info(f"Audit trail created")
+                self.logger.info(f"  File: {audit_file}")
+                result["steps"]["audit_trail"] = "SUCCESS"
+                result["audit_file"] = audit_file
+            else:
+                self.logger.info(f"Audit trail disabled - skipping")
+                result["steps"]["audit_trail"] = "SKIPPED"
 
             # =========================================================
             # Final Success Result
             # =========================================================
             result["status"] = "SUCCESS"
-            result["timestamp_end"] = datetime.utcnow().isoformat()
+            result["timestamp_end"] = utc_now_iso()
+
+            # Write output file if requested (in the background, while the
+            # summary below is logged)
+            self._write_output(output_file, result)
 
             self.logger.info("\n" + "=" * 70)
             self.logger.info("WORKFLOW COMPLETED SUCCESSFULLY")
@@ -418,8 +470,6 @@ class BrowserStackUploader:
                 self.logger.info(f"Commit: {commit_info['commit_sha']}")
             self.logger.info(f"App ID: {upload_result['app_id']}")
 
-            # Write output file if requested
-            self._write_output(output_file, result)
             return result
 
         except Exception as e:
@@ -427,13 +477,13 @@ class BrowserStackUploader:
             self.logger.error(f"Workflow failed: {str(e)}", exc_info=True)
             result["status"] = "FAILED"
             result["error"] = str(e)
-            result["timestamp_end"] = datetime.utcnow().isoformat()
+            result["timestamp_end"] = utc_now_iso()
             self._write_output(output_file, result)
             return result
 
     def _generate_custom_id(self, params: Dict[str, str]) -> str:
         """Generate custom ID for BrowserStack upload"""
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        timestamp = utc_now().strftime("%Y%m%d%H%M%S")
         custom_id = (f"{params['platform']}-{params['app_variant']}-"
                      f"{params['environment']}-{params['build_type']}")
 
@@ -445,16 +495,37 @@ class BrowserStackUploader:
         return custom_id
 
     def _write_output(self, output_file: Optional[str], result: Dict[str, Any]) -> None:
-        """Write result to JSON output file if specified"""
+        """
+        Write result to JSON output file if specified
+
+        The result is serialized right away (later changes to the dict are
+        not picked up); the file itself is written by a background thread.
+        Call wait_for_output() to make sure it has been written.
+        """
         if output_file:
             try:
-                output_path = Path(output_file)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, 'w') as f:
-                    json.dump(result, f, indent=2)
-                self.logger.info(f"Result written to: {output_file}")
+                data = dumps_json(result)
             except Exception as e:
                 self.logger.error(f"Failed to write output file: {e}")
+                return
+            self._output_future = self._io_pool.submit(
+                self._write_output_file, output_file, data
+            )
+
+    def _write_output_file(self, output_file: str, data: bytes) -> None:
+        """Write serialized result to the output file (background thread)"""
+        try:
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(data)
+            self.logger.info(f"Result written to: {output_file}")
+        except Exception as e:
+            self.logger.error(f"Failed to write output file: {e}")
+
+    def wait_for_output(self) -> None:
+        """Wait until a pending output file write has finished"""
+        if self._output_future is not None:
+            self._output_future.result()
 
 
 def main():
@@ -502,6 +573,9 @@ Examples:
                         help='Configuration file path')
     parser.add_argument('--output-file', default=None,
                         help='Output JSON file for results')
+    parser.add_argument('--audit', action=argparse.BooleanOptionalAction, default=None,
+                        help='Write the audit trail JSON file '
+                             '(default: audit.enabled from config, true if unset)')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
 
@@ -523,7 +597,8 @@ Examples:
     # Run uploader
     try:
         uploader = BrowserStackUploader(args.config_file, args.verbose)
-        result = uploader.run(params, args.output_file)
+        result = uploader.run(params, args.output_file, audit=args.audit)
+        uploader.wait_for_output()
 
         # Exit with appropriate code
         sys.exit(0 if result['status'] == 'SUCCESS' else 1)
@@ -12,8 +12,35 @@ Key Concepts:
 """
 
 import requests
-from datetime import datetime
 from logger import get_logger
+from utils import dumps_json, utc_now_iso
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Static parts of the Teams card, built once at import instead of per message
+CARD_CONTEXT = "https://schema.org/extensions"
+CARD_THEME_COLOR = "0078D4"  # Microsoft blue
+DASHBOARD_URL = "https://app-live.browserstack.com"
+
+# Card title emoji per platform
+PLATFORM_EMOJI = {
+    'android': '🤖',
+    'android_hw': '📱',
+    'ios': '🍎'
+}
+DEFAULT_PLATFORM_EMOJI = '📱'
+
+
+def _open_uri_action(name, uri):
+    """Build an OpenUri action button for the Teams card"""
+    return {
+        "@type": "OpenUri",
+        "name": name,
+        "targets": [{"os": "default", "uri": uri}]
+    }
+
+
+_DASHBOARD_ACTION = _open_uri_action("BrowserStack Dashboard", DASHBOARD_URL)
 
 
 class TeamsNotifier:
@@ -33,16 +60,55 @@ class TeamsNotifier:
         self.config = config
         self.log = get_logger("TeamsNotifier")
 
-        # Get Teams webhook URL
+        # Read Teams settings once (Config raises ValueError when the
+        # webhook URL is missing)
         try:
-            teams_config = config.get_teams_config()
-            self.webhook_url = teams_config.get('webhook_url')
-        except:
-            self.webhook_url = None
+            self.teams_config = config.teams
+        except ValueError:
+            self.teams_config = None
+
+        self.webhook_url = self.teams_config.webhook_url if self.teams_config else None
 
         if not self.webhook_url:
             self.log.warning("Teams webhook URL not configured")
 
+        # HTTP session for webhook calls (created on first notification)
+        self._session = None
+
+    def _create_session(self):
+        """
+        Create HTTP session for the Teams webhook
+
+        The session keeps the HTTPS connection alive between notifications
+        and retries, so only the first request pays for the TLS handshake.
+        Throttled (429) and unavailable (502/503/504) responses are retried
+        with exponential backoff; Teams does not post the message for those.
+        Read timeouts are not retried: Teams may already have posted the
+        card, and a retry would post it twice.
+
+        Returns:
+            requests.Session: Session with retry strategy
+        """
+        session = requests.Session()
+
+        retry_strategy = Retry(
+            total=3,
+            read=False,  # No retry once the request was sent (avoids duplicate cards)
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=['POST'],
+            respect_retry_after_header=True
+        )
+
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=1,  # Only the webhook host
+            pool_maxsize=4
+        )
+        session.mount('https://', adapter)
+
+        return session
+
     def send_notification(self, platform, app_variant, environment, build_type,
                          version, old_app_id, new_app_id, pr_url, source_build_url,
                          yaml_file):
@@ -84,9 +150,12 @@ class TeamsNotifier:
             )
 
             # Send to Teams webhook
-            response = requests.post(
+            if self._session is None:
+                self._session = self._create_session()
+            response = self._session.post(
                 self.webhook_url,
-                json=card,
+                data=dumps_json(card, indent=False),
+                headers={'Content-Type': 'application/json'},
                 timeout=10
             )
 
@@ -186,21 +255,17 @@ class TeamsNotifier:
         Returns:
             dict: Adaptive Card JSON structure
         """
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        timestamp = utc_now_iso() + 'Z'
 
         # Choose emoji based on platform
-        platform_emoji = {
-            'android': '🤖',
-            'android_hw': '📱',
-            'ios': '🍎'
-        }.get(platform, '📱')
+        platform_emoji = PLATFORM_EMOJI.get(platform, DEFAULT_PLATFORM_EMOJI)
 
         # Create Adaptive Card
         card = {
             "@type": "MessageCard",
-            "@context": "https://schema.org/extensions",
+            "@context": CARD_CONTEXT,
             "summary": f"BrowserStack Update - {platform}/{app_variant}/{environment}/{build_type}",
-            "themeColor": "0078D4",  # Microsoft blue
+            "themeColor": CARD_THEME_COLOR,
             "sections": [
                 {
                     "activityTitle": f"{platform_emoji} BrowserStack Update - {app_variant}",
@@ -220,46 +285,14 @@ class TeamsNotifier:
             ],
             # Action buttons at bottom of card
             "potentialAction": [
-                {
-                    "@type": "OpenUri",
-                    "name": "View Pull Request",
-                    "targets": [
-                        {
-                            "os": "default",
-                            "uri": pr_url
-                        }
-                    ]
-                },
-                {
-                    "@type": "OpenUri",
-                    "name": "Source Build",
-                    "targets": [
-                        {
-                            "os": "default",
-                            "uri": source_build_url
-                        }
-                    ]
-                },
-                {
-                    "@type": "OpenUri",
-                    "name": "BrowserStack Dashboard",
-                    "targets": [
-                        {
-                            "os": "default",
-                            "uri": "https://app-live.browserstack.com"
-                        }
-                    ]
-                }
+                _open_uri_action("View Pull Request", pr_url),
+                _open_uri_action("Source Build", source_build_url),
+                _DASHBOARD_ACTION
             ]
         }
 
         # Add QA team mention if configured
-        try:
-            teams_config = self.config.get_teams_config()
-            if teams_config.get('mention_qa'):
-                qa_group = teams_config.get('qa_group', 'QA Team')
-                card["sections"][0]["text"] = f"cc: @{qa_group}"
-        except:
-            pass
+        if self.teams_config and self.teams_config.mention_qa:
+            card["sections"][0]["text"] = f"cc: @{self.teams_config.qa_group}"
 
         return card
@@ -12,13 +12,23 @@ Common helper functions for:
 
 import json
 import hashlib
+import mmap
+import os
 import re
+import string
 import time
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from logger import get_logger
 
+# orjson is optional; it serializes several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger("Utils")
 
 
@@ -26,6 +36,33 @@ logger = get_logger("Utils")
 # PARAMETER VALIDATION
 # ============================================================================
 
+VALID_PLATFORMS = frozenset({'android', 'android_hw', 'ios'})
+VALID_ENVIRONMENTS = frozenset({'production', 'staging'})
+VALID_BUILD_TYPES = frozenset({'Debug', 'Release'})
+VALID_VARIANTS = frozenset({'agent', 'retail', 'wallet'})
+
+REQUIRED_PARAMETERS = ('platform', 'environment', 'build_type', 'app_variant',
+                       'version', 'build_id', 'source_build_url')
+REQUIRED_PARAMETER_SET = frozenset(REQUIRED_PARAMETERS)
+
+# Parameter name -> allowed values
+ENUM_PARAMETERS = {
+    'platform': VALID_PLATFORMS,
+    'environment': VALID_ENVIRONMENTS,
+    'build_type': VALID_BUILD_TYPES,
+    'app_variant': VALID_VARIANTS,
+}
+
+# Characters allowed in the -suffix of an X.Y.Z-suffix version
+_VERSION_SUFFIX_CHARS = frozenset(string.ascii_letters + string.digits + '.')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-.]')
+# Same rule as the regex above, as a str.translate table for ASCII names
+_SAFE_FILENAME_ASCII = frozenset(string.ascii_letters + string.digits + '_-.')
+_UNSAFE_FILENAME_ASCII_TABLE = str.maketrans(
+    {chr(c): '_' for c in range(128) if chr(c) not in _SAFE_FILENAME_ASCII}
+)
+
+
 def validate_parameters(params: Dict[str, str]) -> List[str]:
     """
     Validate all input parameters
@@ -44,53 +81,38 @@ def validate_parameters(params: Dict[str, str]) -> List[str]:
     """
     errors = []
 
-    # Check required fields
-    required = ['platform', 'environment', 'build_type', 'app_variant',
-                'version', 'build_id', 'source_build_url']
-    for field in required:
-        if field not in params or not params[field]:
-            errors.append(f"Missing required parameter: {field}")
-
-    # Validate platform
-    valid_platforms = ['android', 'android_hw', 'ios']
-    if 'platform' in params and params['platform'] not in valid_platforms:
-        errors.append(f"Invalid platform: {params['platform']}. "
-                     f"Must be one of {valid_platforms}")
-
-    # Validate environment
-    valid_environments = ['production', 'staging']
-    if 'environment' in params and params['environment'] not in valid_environments:
-        errors.append(f"Invalid environment: {params['environment']}. "
-                     f"Must be one of {valid_environments}")
-
-    # Validate build type
-    valid_build_types = ['Debug', 'Release']
-    if 'build_type' in params and params['build_type'] not in valid_build_types:
-        errors.append(f"Invalid build_type: {params['build_type']}. "
-                     f"Must be one of {valid_build_types}")
-
-    # Validate app variant
-    valid_variants = ['agent', 'retail', 'wallet']
-    if 'app_variant' in params and params['app_variant'] not in valid_variants:
-        errors.append(f"Invalid app_variant: {params['app_variant']}. "
-                     f"Must be one of {valid_variants}")
+    # Look every field up once; empty values are only reported as missing
+    values = {field: params.get(field) for field in REQUIRED_PARAMETERS}
+
+    # Check required fields (one set comparison when all are present, the
+    # usual case; messages keep REQUIRED_PARAMETERS order)
+    present = {field for field, value in values.items() if value}
+    if not REQUIRED_PARAMETER_SET <= present:
+        errors.extend(f"Missing required parameter: {field}"
+                      for field in REQUIRED_PARAMETERS if field not in present)
+
+    # Validate enum values (platform, environment, build_type, app_variant)
+    for field, allowed in ENUM_PARAMETERS.items():
+        value = values[field]
+        if value and value not in allowed:
+            errors.append(f"Invalid {field}: {value}. "
+                         f"Must be one of {sorted(allowed)}")
 
     # Validate version format (semantic versioning)
-    if 'version' in params:
-        version = params['version']
-        if not is_valid_version(version):
-            errors.append(f"Invalid version format: {version}. "
-                         f"Expected semantic version (e.g., 1.2.0 or 1.3.0-beta)")
+    version = values['version']
+    if version and not is_valid_version(version):
+        errors.append(f"Invalid version format: {version}. "
+                     f"Expected semantic version (e.g., 1.2.0 or 1.3.0-beta)")
 
     # Validate URL format
-    if 'source_build_url' in params:
-        url = params['source_build_url']
-        if not url.startswith(('http://', 'https://')):
-            errors.append(f"Invalid source_build_url: {url}. Must be HTTP(S) URL")
+    url = values['source_build_url']
+    if url and not url.startswith(('http://', 'https://')):
+        errors.append(f"Invalid source_build_url: {url}. Must be HTTP(S) URL")
 
     return errors
 
 
+@lru_cache(maxsize=1024)
 def is_valid_version(version: str) -> bool:
     """
     Validate semantic version format
@@ -108,9 +130,67 @@ def is_valid_version(version: str) -> bool:
     Returns:
         bool: True if valid semantic version, False otherwise
     """
-    # Pattern: X.Y.Z or X.Y.Z-suffix
-    pattern = r'^(\d+)\.(\d+)\.(\d+)(-[a-zA-Z0-9.]+)?$'
-    return bool(re.match(pattern, version))
+    core, dash, suffix = version.partition('-')
+    parts = core.split('.')
+    if len(parts) != 3 or not all(part.isdecimal() for part in parts):
+        return False
+    if dash:
+        return bool(suffix) and _VERSION_SUFFIX_CHARS.issuperset(suffix)
+    return True
+
+
+# ============================================================================
+# TIMESTAMPS
+# ============================================================================
+
+def utc_now() -> datetime:
+    """
+    Current UTC time as a naive datetime
+
+    Same value as the deprecated datetime.utcnow(), so existing timestamp
+    formats (no "+00:00" offset) are unchanged.
+
+    Returns:
+        datetime: Current UTC time without tzinfo
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time in ISO 8601 format
+
+    Example: "2024-01-15T10:30:00.123456"
+
+    Returns:
+        str: ISO 8601 timestamp (append 'Z' where a UTC marker is wanted)
+    """
+    return utc_now().isoformat()
+
+
+# ============================================================================
+# JSON SERIALIZATION
+# ============================================================================
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON
+
+    Uses orjson when it is installed and falls back to the standard
+    json module otherwise. Both produce the same layout (2-space indent).
+
+    Args:
+        data: JSON-serializable object
+        indent (bool): Pretty-print with a 2-space indent
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 
 # ============================================================================
@@ -145,12 +225,13 @@ def create_audit_trail(params: Dict[str, str], artifact_info: Dict[str, Any],
     """
     # Build audit data structure
     audit_data = {
-        "timestamp": datetime.utcnow().isoformat() + 'Z',
+        "timestamp": utc_now_iso() + 'Z',
         "parameters": params,
         "artifact": {
             "path": artifact_info.get('path'),
             "size": artifact_info.get('size'),
             "md5": artifact_info.get('md5'),
+            "sha256": artifact_info.get('sha256'),
             "modified_time": artifact_info.get('modified_time')
         },
         "browserstack": {
@@ -180,8 +261,7 @@ def create_audit_trail(params: Dict[str, str], artifact_info: Dict[str, Any],
     audit_path = Path(audit_file)
 
     # Write audit trail to file
-    with open(audit_path, 'w') as f:
-        json.dump(audit_data, f, indent=2)
+    audit_path.write_bytes(dumps_json(audit_data))
 
     logger.info(f"Audit trail created: {audit_path}")
     return str(audit_path)
@@ -191,11 +271,56 @@ def create_audit_trail(params: Dict[str, str], artifact_info: Dict[str, Any],
 # FILE OPERATIONS
 # ============================================================================
 
+# Files at least this large are memory-mapped for hashing (below it, the
+# cost of setting up the mapping outweighs the saved read calls)
+MMAP_THRESHOLD = 10 * 1024 * 1024
+
+# File signatures (magic bytes)
+ZIP_MAGIC = b'PK'  # ZIP-based formats (APK, AAB, IPA)
+MACH_O_MAGICS = frozenset({
+    b'\xca\xfe\xba\xbe',  # Mach-O (iOS)
+    b'\xfe\xed\xfa\xce',  # Mach-O (iOS)
+    b'\xce\xfa\xed\xfe',  # Mach-O (iOS)
+})
+
+
+def calculate_file_digest(file_path: Path, algorithm: str = 'sha256') -> str:
+    """
+    Calculate a checksum of file
+
+    Files of MMAP_THRESHOLD bytes or more are memory-mapped and hashed in
+    a single update() call. Smaller files (and files that can't be mapped,
+    e.g. on some network shares) go through hashlib.file_digest(), which
+    runs the read/update loop in C. Either way there is no Python-level
+    loop, and OpenSSL uses the CPU's SHA instructions where available.
+
+    Args:
+        file_path (Path): Path to file
+        algorithm (str): hashlib algorithm name ('sha256', 'md5', ...)
+
+    Returns:
+        str: Hash in hexadecimal format
+    """
+    # Unbuffered: each read goes straight to the OS
+    with open(file_path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return hashlib.new(algorithm, mm).hexdigest()
+            except (OSError, ValueError):
+                # Mapping not supported here: fall back to reading
+                pass
+
+        return hashlib.file_digest(f, algorithm).hexdigest()
+
+
 def calculate_file_md5(file_path: Path) -> str:
     """
     Calculate MD5 checksum of file
 
-    Reads file in chunks for memory efficiency with large files.
+    Kept for existing audit trails; see calculate_file_digest().
 
     Args:
         file_path (Path): Path to file
@@ -203,14 +328,20 @@ def calculate_file_md5(file_path: Path) -> str:
     Returns:
         str: MD5 hash in hexadecimal format
     """
-    md5_hash = hashlib.md5()
+    return calculate_file_digest(file_path, 'md5')
 
-    # Read file in 8KB chunks
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            md5_hash.update(chunk)
 
-    return md5_hash.hexdigest()
+def calculate_file_sha256(file_path: Path) -> str:
+    """
+    Calculate SHA-256 checksum of file
+
+    Args:
+        file_path (Path): Path to file
+
+    Returns:
+        str: SHA-256 hash in hexadecimal format
+    """
+    return calculate_file_digest(file_path, 'sha256')
 
 
 def get_file_type(file_path: Path) -> Optional[str]:
@@ -227,30 +358,22 @@ def get_file_type(file_path: Path) -> Optional[str]:
     Returns:
         str: File type ('apk', 'ipa', 'aab') or None if unknown
     """
-    magic_bytes = {
-        b'PK': 'apk',  # ZIP-based formats
-        b'\xca\xfe\xba\xbe': 'mach-o',  # Mach-O (iOS)
-        b'\xfe\xed\xfa\xce': 'mach-o',  # Mach-O (iOS)
-        b'\xce\xfa\xed\xfe': 'mach-o',  # Mach-O (iOS)
-    }
-
     try:
-        # Read first 4 bytes
-        with open(file_path, 'rb') as f:
+        # Read first 4 bytes (unbuffered: no 8KB read buffer for 4 bytes)
+        with open(file_path, 'rb', buffering=0) as f:
             header = f.read(4)
 
-        # Check against known magic bytes
-        for magic, ftype in magic_bytes.items():
-            if header.startswith(magic):
-                # For APK, also check extension
-                if ftype == 'apk' and file_path.suffix.lower() == '.apk':
-                    return 'apk'
-                elif ftype == 'mach-o' and file_path.suffix.lower() == '.ipa':
-                    return 'ipa'
+        suffix = file_path.suffix.lower()
+
+        # Check against known magic bytes. For APK/IPA, also check extension
+        if header.startswith(ZIP_MAGIC) and suffix == '.apk':
+            return 'apk'
+        if header in MACH_O_MAGICS and suffix == '.ipa':
+            return 'ipa'
 
         # Fallback to extension
-        ext = file_path.suffix.lower().lstrip('.')
-        if ext in ['apk', 'ipa', 'aab']:
+        ext = suffix.lstrip('.')
+        if ext in ('apk', 'ipa', 'aab'):
             return ext
 
         return None
@@ -260,6 +383,10 @@ def get_file_type(file_path: Path) -> Optional[str]:
         return None
 
 
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+@lru_cache(maxsize=256)
 def format_bytes(bytes_value: int) -> str:
     """
     Format bytes to human-readable format
@@ -275,11 +402,13 @@ def format_bytes(bytes_value: int) -> str:
     Returns:
         str: Formatted string (e.g., "10.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.2f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+
+    # Each unit is 2**10 times the previous one, so the bit length of the
+    # value picks the unit directly (one division instead of a loop)
+    unit_index = min((int(bytes_value).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (unit_index * 10)):.2f} {BYTE_UNITS[unit_index]}"
 
 
 def sanitize_filename(filename: str) -> str:
@@ -298,9 +427,12 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: Sanitized filename
     """
-    # Replace special characters with underscore
-    sanitized = re.sub(r'[^\w\-.]', '_', filename)
-    return sanitized
+    # Replace special characters with underscore. ASCII names (the usual
+    # case) go through a prebuilt translate table; anything else needs the
+    # regex for its Unicode-aware \w.
+    if filename.isascii():
+        return filename.translate(_UNSAFE_FILENAME_ASCII_TABLE)
+    return _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
 
 
 # ============================================================================
@@ -308,28 +440,47 @@ def sanitize_filename(filename: str) -> str:
 # ============================================================================
 
 def retry_with_backoff(func, max_attempts: int = 3, initial_delay: float = 2,
-                       backoff_factor: float = 2):
+                       backoff_factor: float = 2, retry_on: tuple = (OSError,),
+                       max_total: Optional[float] = 60, delay_for=None):
     """
     Execute function with exponential backoff retry
 
-    Retries on any exception with exponential backoff:
+    Retries on I/O and network errors with exponential backoff:
     - Attempt 1: Wait 2 seconds
     - Attempt 2: Wait 4 seconds
     - Attempt 3: Wait 8 seconds
 
+    Other exceptions (e.g. a KeyError from a bug) are raised right away
+    instead of being retried. requests' exceptions are OSError subclasses,
+    so network failures are retried by default.
+
+    The whole call is limited to max_total seconds, measured with a
+    monotonic clock: a wait that would end after the deadline is cut
+    short, and no attempt is started once the deadline has passed.
+
+    delay_for lets the caller ask for a longer wait after a specific error,
+    e.g. the Retry-After of a 429 response: the wait is the larger of the
+    backoff delay and what delay_for returns (None means no minimum).
+
     Args:
         func: Function to execute
         max_attempts (int): Maximum number of attempts (default 3)
         initial_delay (float): Initial delay in seconds (default 2)
         backoff_factor (float): Backoff multiplier (default 2)
+        retry_on (tuple): Exception types that trigger a retry (default OSError)
+        max_total (float): Time budget in seconds for all attempts and waits
+            (default 60; None for no limit)
+        delay_for: Optional function(exception) -> minimum wait in seconds
+            before the next attempt, or None
 
     Returns:
         Function result
 
     Raises:
-        Last exception if all attempts fail
+        Last exception if all attempts fail or the time budget runs out
     """
-    last_exception = None
+    start = time.monotonic()
+    deadline = start + max_total if max_total is not None else None
     delay = initial_delay
 
     # Try up to max_attempts times
@@ -337,19 +488,26 @@ def retry_with_backoff(func, max_attempts: int = 3, initial_delay: float = 2,
         try:
             return func()
 
-        except Exception as e:
-            # Save exception
-            last_exception = e
-
-            if attempt < max_attempts:
-                # Calculate next delay
-                logger.warning(f"Attempt {attempt} failed: {e}. "
-                              f"Retrying in {delay}s...")
-                time.sleep(delay)
-                delay *= backoff_factor
-            else:
-                # Last attempt failed
-                logger.error(f"All {max_attempts} attempts failed")
+        except retry_on as e:
+            elapsed = time.monotonic() - start
 
-    # Raise the last exception
-    raise last_exception
+            if attempt == max_attempts:
+                # Last attempt failed
+                logger.error(f"All {max_attempts} attempts failed ({elapsed:.1f}s)")
+                raise
+
+            # Wait, but not past the deadline
+            sleep_for = delay
+            if delay_for is not None:
+                sleep_for = max(sleep_for, delay_for(e) or 0)
+            if deadline is not None:
+                sleep_for = min(sleep_for, deadline - time.monotonic())
+                if sleep_for <= 0:
+                    logger.error(f"Attempt {attempt} failed: {e}. "
+                                 f"Retry time budget of {max_total}s used up ({elapsed:.1f}s)")
+                    raise
+
+            logger.warning(f"Attempt {attempt} failed after {elapsed:.1f}s: {e}. "
+                          f"Retrying in {sleep_for:.1f}s...")
+            time.sleep(sleep_for)
+            delay *= backoff_factor
@@ -10,10 +10,27 @@ Key Concepts:
 - Shared metadata: shared.yml tracks which builds were updated
 """
 
+import os
 import yaml
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from logger import get_logger
+from utils import dumps_json, utc_now_iso
+
+# Use the fast C (libyaml) loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# shared.yml is not rewritten when the same build was recorded less than
+# this many seconds ago (retried runs would only change the timestamps)
+SHARED_REWRITE_WINDOW = 300
+
+# Emitter line width: large enough that long scalars stay on one line and
+# the emitter never has to look for wrap points
+YAML_LINE_WIDTH = 1 << 16
 
 
 class YAMLUpdater:
@@ -34,7 +51,17 @@ class YAMLUpdater:
         self.config = config
         self.repo_path = Path(repo_path)
         self.log = get_logger(__name__)
-        self.yaml_config = config.get_yaml_config()
+        self.yaml_config = config.yaml_structure
+        self._yaml_files = self.yaml_config.yaml_files or {}
+
+        # Parsed YAML by path: {path: (mtime_ns, size, content)}. Lets
+        # get_current_app_id, update_app_id and validate_yaml_files share
+        # one parse of each file.
+        self._yaml_cache = {}
+
+        # Flat app ID lookup by path: {path: (mtime_ns, size, index)} where
+        # index maps (app_variant, environment, build_type) -> app_id
+        self._app_id_index = {}
 
     def get_current_app_id(self, platform, app_variant, environment, build_type):
         """
@@ -54,14 +81,17 @@ class YAMLUpdater:
         yaml_file = self._get_yaml_file_path(platform, app_variant)
 
         try:
-            # Read YAML file
-            with open(yaml_file, 'r') as f:
-                content = yaml.safe_load(f)
-
-            # Navigate nested structure: apps[app_variant][environment][build_type]
-            app_id = content.get('apps', {}).get(app_variant, {}).get(
-                environment, {}
-            ).get(build_type, {}).get('app_id', 'NOT_SET')
+            # Flat index of apps[app_variant][environment][build_type], built
+            # once per version of the file
+            st = os.stat(yaml_file)
+            entry = self._app_id_index.get(yaml_file)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                index = entry[2]
+            else:
+                index = self._index_app_ids(self._load_yaml_file(yaml_file))
+                self._app_id_index[yaml_file] = (st.st_mtime_ns, st.st_size, index)
+
+            app_id = index.get((app_variant, environment, build_type), 'NOT_SET')
 
             self.log.debug(f"Current app_id: {app_id}")
             return app_id
@@ -76,12 +106,40 @@ class YAMLUpdater:
             self.log.warning(f"Error reading current app_id: {e}")
             return 'NOT_SET'
 
+    @staticmethod
+    def _index_app_ids(content):
+        """
+        Flatten the apps section of a YAML file into a lookup table
+
+        Args:
+            content (dict): Parsed YAML file (None for an empty file)
+
+        Returns:
+            dict: {(app_variant, environment, build_type): app_id}
+        """
+        index = {}
+        apps = content.get('apps') if isinstance(content, dict) else None
+        if not isinstance(apps, dict):
+            return index
+
+        for app_variant, environments in apps.items():
+            if not isinstance(environments, dict):
+                continue
+            for environment, build_types in environments.items():
+                if not isinstance(build_types, dict):
+                    continue
+                for build_type, app_data in build_types.items():
+                    if isinstance(app_data, dict) and 'app_id' in app_data:
+                        index[(app_variant, environment, build_type)] = app_data['app_id']
+
+        return index
+
     def update_app_id(self, platform, app_variant, environment, build_type,
                       new_app_id, version, build_id):
         """
         Update app ID in YAML file
 
-        Updates two files:
+        Updates two files (at the same time, when they are different files):
         1. Platform-specific file: {platform}/{app_variant}.yml
         2. Shared metadata file: shared.yml
 
@@ -100,44 +158,138 @@ class YAMLUpdater:
         self.log.info(f"Updating YAML files for {platform}/{app_variant}/{environment}/{build_type}")
 
         updated_files = []
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        timestamp = utc_now_iso() + 'Z'
 
-        # 1. Update specific app variant YAML file
         yaml_file = self._get_yaml_file_path(platform, app_variant)
-        self._update_yaml_file(
-            yaml_file=yaml_file,
-            app_variant=app_variant,
-            environment=environment,
-            build_type=build_type,
-            new_app_id=new_app_id,
-            version=version,
-            build_id=build_id,
-            timestamp=timestamp
-        )
+        shared_file = self._get_shared_yaml_file_path()
+
+        # The two files are independent, so they are loaded and written in
+        # parallel (libyaml releases the GIL while it works). If both names
+        # point to the same file, one worker updates it in turn.
+        workers = 2 if yaml_file != shared_file else 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 1. Update specific app variant YAML file
+            variant_future = executor.submit(
+                self._update_yaml_file,
+                yaml_file=yaml_file,
+                app_variant=app_variant,
+                environment=environment,
+                build_type=build_type,
+                new_app_id=new_app_id,
+                version=version,
+                build_id=build_id,
+                timestamp=timestamp
+            )
+
+            # 2. Update shared.yml with metadata
+            shared_future = executor.submit(
+                self._update_shared_yaml,
+                shared_file=shared_file,
+                platform=platform,
+                app_variant=app_variant,
+                environment=environment,
+                build_type=build_type,
+                build_id=build_id,
+                timestamp=timestamp
+            )
+
+            # Wait for both (re-raises the first error)
+            variant_future.result()
+            shared_future.result()
 
         # Convert to relative path for git operations
         relative_path = yaml_file.relative_to(self.repo_path)
         updated_files.append(str(relative_path))
         self.log.info(f"Updated: {relative_path}")
 
-        # 2. Update shared.yml with metadata
-        shared_file = self._get_shared_yaml_file_path()
-        self._update_shared_yaml(
-            shared_file=shared_file,
-            platform=platform,
-            app_variant=app_variant,
-            environment=environment,
-            build_type=build_type,
-            build_id=build_id,
-            timestamp=timestamp
-        )
-
         relative_shared = shared_file.relative_to(self.repo_path)
         updated_files.append(str(relative_shared))
         self.log.info(f"Updated: {relative_shared}")
 
         return updated_files
 
+    def update_app_ids(self, updates, max_workers=4):
+        """
+        Update app IDs for several builds at once
+
+        Different variant files are updated in parallel (libyaml releases
+        the GIL while it works). Updates that map to the same file (e.g.
+        wallet sharing the agent file) are applied to it in turn by one
+        worker. shared.yml is updated last, one record after another.
+
+        Example:
+            updater.update_app_ids([
+                {'platform': 'android', 'app_variant': 'agent',
+                 'environment': 'production', 'build_type': 'Release',
+                 'new_app_id': 'bs://abc', 'version': '1.2.0', 'build_id': '123'},
+                {'platform': 'ios', 'app_variant': 'agent', ...},
+            ])
+
+        Args:
+            updates (list): One dict of update_app_id() arguments per build
+            max_workers (int): Maximum number of files updated at once
+
+        Returns:
+            list: Files updated (relative paths, each listed once)
+        """
+        updates = list(updates)
+        if not updates:
+            return []
+
+        self.log.info(f"Updating YAML files for {len(updates)} builds")
+
+        timestamp = utc_now_iso() + 'Z'
+        shared_file = self._get_shared_yaml_file_path()
+
+        # Group updates by target file
+        updates_by_file = {}
+        for update in updates:
+            yaml_file = self._get_yaml_file_path(update['platform'], update['app_variant'])
+            updates_by_file.setdefault(yaml_file, []).append(update)
+
+        def update_file(yaml_file, file_updates):
+            for update in file_updates:
+                self._update_yaml_file(
+                    yaml_file=yaml_file,
+                    app_variant=update['app_variant'],
+                    environment=update['environment'],
+                    build_type=update['build_type'],
+                    new_app_id=update['new_app_id'],
+                    version=update.get('version'),
+                    build_id=update['build_id'],
+                    timestamp=timestamp
+                )
+
+        workers = min(max_workers, len(updates_by_file))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(update_file, yaml_file, file_updates)
+                       for yaml_file, file_updates in updates_by_file.items()]
+            # result() re-raises the first failed update (in input order)
+            for future in futures:
+                future.result()
+
+        # Record every build in shared.yml
+        for update in updates:
+            self._update_shared_yaml(
+                shared_file=shared_file,
+                platform=update['platform'],
+                app_variant=update['app_variant'],
+                environment=update['environment'],
+                build_type=update['build_type'],
+                build_id=update['build_id'],
+                timestamp=timestamp
+            )
+
+        updated_files = [str(yaml_file.relative_to(self.repo_path))
+                         for yaml_file in updates_by_file]
+        relative_shared = str(shared_file.relative_to(self.repo_path))
+        if relative_shared not in updated_files:
+            updated_files.append(relative_shared)
+
+        for file_path in updated_files:
+            self.log.info(f"Updated: {file_path}")
+        return updated_files
+
     def _get_yaml_file_path(self, platform, app_variant):
         """
         Get path to YAML file for app variant
@@ -151,12 +303,9 @@ class YAMLUpdater:
         Returns:
             Path: Full path to YAML file
         """
-        yaml_files = self.yaml_config.get('yaml_files', {})
-
         # Look up file name in config
-        if platform in yaml_files and app_variant in yaml_files[platform]:
-            file_name = yaml_files[platform][app_variant]
-        else:
+        file_name = (self._yaml_files.get(platform) or {}).get(app_variant)
+        if not file_name:
             # Fallback to default naming
             self.log.warning(
                 f"YAML file mapping not found for {platform}/{app_variant}, "
@@ -176,7 +325,7 @@ class YAMLUpdater:
         Returns:
             Path: Full path to shared.yml
         """
-        shared_file = self.yaml_config.get('shared_file', 'shared.yml')
+        shared_file = self.yaml_config.shared_file
         return self.repo_path / shared_file
 
     def _update_yaml_file(self, yaml_file, app_variant, environment, build_type,
@@ -211,26 +360,14 @@ class YAMLUpdater:
 
         # Load existing content or create empty dict
         if yaml_file.exists():
-            with open(yaml_file, 'r') as f:
-                content = yaml.safe_load(f) or {}
+            content = self._load_yaml_file(yaml_file, for_update=True) or {}
         else:
             content = {}
 
-        # Ensure 'apps' key exists
-        if 'apps' not in content:
-            content['apps'] = {}
-
-        # Ensure app_variant key exists
-        if app_variant not in content['apps']:
-            content['apps'][app_variant] = {}
-
-        # Ensure environment key exists
-        if environment not in content['apps'][app_variant]:
-            content['apps'][app_variant][environment] = {}
-
-        # Ensure build_type key exists
-        if build_type not in content['apps'][app_variant][environment]:
-            content['apps'][app_variant][environment][build_type] = {}
+        # Ensure apps -> app_variant -> environment exists
+        environment_data = content.setdefault('apps', {}).setdefault(
+            app_variant, {}
+        ).setdefault(environment, {})
 
         # Update the app ID and metadata
         app_data = {
@@ -246,10 +383,11 @@ class YAMLUpdater:
         if version:
             app_data['version'] = version
 
-        content['apps'][app_variant][environment][build_type] = app_data
+        environment_data[build_type] = app_data
 
         # Write updated content back to file
-        self._write_yaml_file(yaml_file, content)
+        self._write_yaml_file(yaml_file, content,
+                              as_json=self.yaml_config.emit_json_compatible)
         self.log.debug(f"YAML file updated: {yaml_file}")
 
     def _update_shared_yaml(self, shared_file, platform, app_variant,
@@ -278,11 +416,21 @@ class YAMLUpdater:
 
         # Load existing content or create empty dict
         if shared_file.exists():
-            with open(shared_file, 'r') as f:
-                content = yaml.safe_load(f) or {}
+            content = self._load_yaml_file(shared_file) or {}
         else:
             content = {}
 
+        # A retried run for the same build only changes the timestamps;
+        # leave the file alone if it was written moments ago
+        artifacts = content.get('artifacts')
+        previous = artifacts.get(platform, {}).get(app_variant) if isinstance(artifacts, dict) else None
+        if self._is_recent_duplicate(previous, build_id, environment, build_type, timestamp):
+            self.log.debug(f"Shared YAML already up to date for build {build_id}, not rewriting")
+            return
+
+        # The content is modified below: take it out of the cache
+        self._yaml_cache.pop(shared_file, None)
+
         # Ensure required keys exist
         if 'browserstack' not in content:
             content['browserstack'] = {
@@ -297,16 +445,8 @@ class YAMLUpdater:
         # Update timestamp
         content['browserstack']['last_updated'] = timestamp
 
-        # Ensure platform entry exists
-        if platform not in content['artifacts']:
-            content['artifacts'][platform] = {}
-
-        # Ensure app_variant entry exists
-        if app_variant not in content['artifacts'][platform]:
-            content['artifacts'][platform][app_variant] = {}
-
-        # Update metadata
-        content['artifacts'][platform][app_variant] = {
+        # Update metadata (the app_variant entry is replaced as a whole)
+        content['artifacts'].setdefault(platform, {})[app_variant] = {
             'last_updated': timestamp,
             'last_updated_by': 'devops-automation',
             'last_build_id': build_id,
@@ -317,10 +457,103 @@ class YAMLUpdater:
         self._write_yaml_file(shared_file, content)
         self.log.debug(f"Shared YAML file updated: {shared_file}")
 
-    def _write_yaml_file(self, yaml_file, content):
+    @staticmethod
+    def _is_recent_duplicate(previous, build_id, environment, build_type, timestamp):
+        """
+        Check if a shared.yml entry already records this build
+
+        Args:
+            previous (dict): Existing artifacts[platform][app_variant] entry
+            build_id, environment, build_type: The update being applied
+            timestamp (str): ISO format timestamp of the update
+
+        Returns:
+            bool: True if the entry matches apart from a timestamp less than
+                SHARED_REWRITE_WINDOW seconds older
+        """
+        if not isinstance(previous, dict):
+            return False
+
+        if (previous.get('last_build_id') != build_id
+                or previous.get('last_updated_by') != 'devops-automation'
+                or previous.get('app_variants_updated') != [f"{environment}/{build_type}"]):
+            return False
+
+        try:
+            age = (datetime.fromisoformat(timestamp)
+                   - datetime.fromisoformat(str(previous.get('last_updated')))).total_seconds()
+        except (TypeError, ValueError):
+            # Missing or unparsable timestamp: rewrite
+            return False
+
+        return 0 <= age < SHARED_REWRITE_WINDOW
+
+    def _load_yaml_file(self, yaml_file, for_update=False):
+        """
+        Load a YAML file, reusing the parsed content if it hasn't changed
+
+        A cached entry is used only while the file's mtime and size still
+        match, so edits made outside this class are always picked up.
+
+        Args:
+            yaml_file (Path): Path to YAML file
+            for_update (bool): The caller will modify the content. The entry
+                is taken out of the cache (and put back by _write_yaml_file)
+                so changes that are never written can't leak into it.
+
+        Returns:
+            Parsed YAML content (must not be modified unless for_update)
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            yaml.YAMLError: If the file has invalid YAML
+        """
+        st = os.stat(yaml_file)
+        entry = self._yaml_cache.pop(yaml_file, None) if for_update else self._yaml_cache.get(yaml_file)
+
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+
+        with open(yaml_file, 'r') as f:
+            content = yaml.load(f, Loader=SafeLoader)
+
+        if not for_update:
+            self._yaml_cache[yaml_file] = (st.st_mtime_ns, st.st_size, content)
+        return content
+
+    def _write_yaml_file(self, yaml_file, content, as_json=False):
         """
         Write YAML content to file with proper formatting
 
+        The written content is cached, so reading the file back (e.g. in
+        validate_yaml_files) doesn't parse it again.
+
+        Args:
+            yaml_file (Path): Path to YAML file
+            content (dict): Content to write
+            as_json (bool): Write indented JSON instead. JSON is valid YAML,
+                so readers are unaffected, and it is much faster to emit.
+        """
+        data = None
+        if as_json:
+            try:
+                data = dumps_json(content) + b'\n'
+            except TypeError:
+                # Not representable as JSON (e.g. non-string keys): keep YAML
+                data = None
+
+        if data is not None:
+            yaml_file.write_bytes(data)
+        else:
+            self._dump_yaml(yaml_file, content)
+
+        st = os.stat(yaml_file)
+        self._yaml_cache[yaml_file] = (st.st_mtime_ns, st.st_size, content)
+
+    def _dump_yaml(self, yaml_file, content):
+        """
+        Dump content to a YAML file (block style)
+
         Args:
             yaml_file (Path): Path to YAML file
             content (dict): Content to write
@@ -329,10 +562,12 @@ class YAMLUpdater:
             yaml.dump(
                 content,
                 f,
+                Dumper=SafeDumper,
                 default_flow_style=False,  # Use block style (not inline)
                 sort_keys=False,  # Keep order as written
                 allow_unicode=True,  # Support international characters
                 indent=2,  # 2-space indentation
+                width=YAML_LINE_WIDTH,  # Never wrap long values (URLs, IDs)
                 explicit_start=False  # No --- at start
             )
 
@@ -352,9 +587,9 @@ class YAMLUpdater:
             full_path = self.repo_path / file_path
 
             try:
-                # Try to load YAML file
-                with open(full_path, 'r') as f:
-                    yaml.safe_load(f)
+                # Try to load YAML file (files written by this class are
+                # already known to be valid and come from the cache)
+                self._load_yaml_file(full_path)
                 self.log.debug(f"Valid YAML: {file_path}")
 
             except yaml.YAMLError as e:
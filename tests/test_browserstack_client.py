@@ -0,0 +1,159 @@
+"""
+Unit tests for the browserstack_client module
+
+Tests the HTTP adapter's shared SSL context and upload retries.
+"""
+
+import io
+import json
+import ssl
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+from src.browserstack_client import (
+    BrowserStackClient,
+    BrowserStackHTTPAdapter,
+    parse_retry_after,
+)
+
+
+URL = 'https://api-cloud.browserstack.com/app-automate/upload'
+
+
+class TestSharedSSLContext:
+    """Test that HTTPS connections share one SSL context per CA bundle"""
+
+    def _pool(self, adapter, verify=True):
+        """Get the connection pool requests would use, with certificate options set"""
+        request = requests.Request('POST', URL).prepare()
+        conn = adapter.get_connection_with_tls_context(request, verify)
+        adapter.cert_verify(conn, URL, verify, None)
+        return conn
+
+    def test_pool_uses_shared_context(self):
+        """Test that a pooled HTTPS connection gets the shared context"""
+        adapter = BrowserStackHTTPAdapter()
+        pool = self._pool(adapter)
+
+        context = adapter._ssl_contexts[DEFAULT_CA_BUNDLE_PATH]
+        assert pool.conn_kw['ssl_context'] is context
+        assert pool._new_conn().ssl_context is context
+
+        # Connections of the same pool (and new pools) reuse the context
+        assert self._pool(adapter).conn_kw['ssl_context'] is context
+
+    def test_verification_stays_on(self):
+        """Test that certificates and hostnames are still checked"""
+        adapter = BrowserStackHTTPAdapter()
+        pool = self._pool(adapter)
+        conn = pool._new_conn()
+
+        assert pool.cert_reqs == 'CERT_REQUIRED'
+        assert conn.cert_reqs == 'CERT_REQUIRED'
+        assert conn.ssl_context.verify_mode == ssl.CERT_REQUIRED
+        assert conn.ssl_context.check_hostname is True
+        # The bundle is loaded into the context instead of per connection
+        assert conn.ssl_context.cert_store_stats()['x509_ca'] > 0
+        assert conn.ca_certs is None
+
+    def test_custom_bundle_gets_its_own_context(self, tmp_path):
+        """Test that verify='path' uses a context with that bundle"""
+        bundle = tmp_path / 'ca.pem'
+        bundle.write_text(open(DEFAULT_CA_BUNDLE_PATH).read())
+
+        adapter = BrowserStackHTTPAdapter()
+        default_context = self._pool(adapter).conn_kw['ssl_context']
+        pool = self._pool(adapter, verify=str(bundle))
+
+        assert pool.conn_kw['ssl_context'] is adapter._ssl_contexts[str(bundle)]
+        assert pool.conn_kw['ssl_context'] is not default_context
+
+    def test_ca_certs_kept_without_shared_context(self):
+        """Test that pools without the shared context still load the bundle"""
+        adapter = BrowserStackHTTPAdapter()
+        # A pool built without the context (as with requests < 2.32)
+        pool = adapter.poolmanager.connection_from_url(URL)
+        adapter.cert_verify(pool, URL, True, None)
+
+        assert pool.ca_certs == DEFAULT_CA_BUNDLE_PATH
+        assert pool.cert_reqs == 'CERT_REQUIRED'
+
+    def test_verify_false_uses_default_handling(self):
+        """Test that verify=False doesn't use the shared context"""
+        adapter = BrowserStackHTTPAdapter()
+        pool = self._pool(adapter, verify=False)
+
+        assert 'ssl_context' not in pool.conn_kw
+        assert pool.cert_reqs == 'CERT_NONE'
+
+
+class TestUploadRetry:
+    """Test that uploads are retried with a fresh body, honouring Retry-After"""
+
+    def _client(self):
+        """Create a client with a fast retry configuration"""
+        config = SimpleNamespace(
+            browserstack=SimpleNamespace(
+                username='user', access_key='key',
+                api_endpoint='https://api-cloud.browserstack.com/app-automate/upload',
+                upload_timeout=30, max_requests_per_minute=None
+            ),
+            retry=SimpleNamespace(max_attempts=3, initial_delay=0.01, backoff_factor=2)
+        )
+        return BrowserStackClient(config)
+
+    def _response(self, status, body=b'', headers=None):
+        """Build a requests.Response without a server"""
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'Too Many Requests' if status == 429 else 'OK'
+        response._content = body
+        response.raw = io.BytesIO(body)
+        response.headers.update(headers or {})
+        return response
+
+    def test_429_waits_for_retry_after(self, tmp_path, monkeypatch):
+        """Test that a 429 is retried after its Retry-After delay with the full file"""
+        artifact = tmp_path / 'app-release.apk'
+        artifact.write_bytes(b'PK' + b'x' * 100000)
+
+        client = self._client()
+        responses = [
+            self._response(429, headers={'Retry-After': '7'}),
+            self._response(200, json.dumps({'app_url': 'bs://new'}).encode()),
+        ]
+        sent = []
+
+        def fake_send(request, **kwargs):
+            # Read the streamed body like a real connection would
+            sent.append(len(request.body.read()))
+            return responses.pop(0)
+
+        sleeps = []
+        monkeypatch.setattr(client.session, 'send', fake_send)
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+        result = client.upload_app(str(artifact), 'custom')
+
+        assert result['app_id'] == 'bs://new'
+        assert sent[0] == sent[1] > 100000  # Second attempt sends the whole file
+        assert sleeps == [7.0]  # Retry-After, not the 0.01s backoff
+
+    @pytest.mark.parametrize('value, expected', [
+        ('7', 7.0),
+        ('0', 0.0),
+        (None, None),
+        ('soon', None),
+        ('Wed, 21 Oct 2015 07:28:00 GMT', 0.0),  # Date in the past
+    ])
+    def test_parse_retry_after(self, value, expected):
+        """Test Retry-After parsing (seconds or HTTP date)"""
+        assert parse_retry_after(value) == expected
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -4,10 +4,13 @@ Unit tests for the config module
 Tests the configuration loader and environment variable substitution.
 """
 
+import json
 import os
 import pytest
 from pathlib import Path
 
+from src.config import Config
+
 
 class TestConfigEnvironmentVariables:
     """Test environment variable substitution in configuration"""
@@ -64,5 +67,63 @@ class TestConfigStructure:
         assert req_path.exists()
 
 
+class TestConfigJsonCache:
+    """Test the JSON cache written next to the YAML configuration"""
+
+    def _write_config(self, tmp_path, text):
+        """Write a YAML config file and return its path and cache path"""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text(text)
+        return config_path, tmp_path / 'config.yaml.json'
+
+    def test_cache_hit(self, tmp_path):
+        """Test that an up-to-date cache is used instead of the YAML file"""
+        config_path, cache_path = self._write_config(tmp_path, 'value: 1\n')
+        assert Config(config_path).config == {'value': 1}
+
+        # Change the cached value only: a cache hit returns it
+        cached = json.loads(cache_path.read_text())
+        cached['config']['value'] = 2
+        cache_path.write_text(json.dumps(cached))
+
+        assert Config(config_path).config == {'value': 2}
+
+    @pytest.mark.skipif(os.name == 'nt', reason='POSIX file modes')
+    def test_cache_readable_by_owner_only(self, tmp_path):
+        """Test that the cache is not readable by other users"""
+        config_path, cache_path = self._write_config(tmp_path, 'token: secret\n')
+        Config(config_path)
+
+        assert cache_path.stat().st_mode & 0o077 == 0
+
+    def test_cache_invalidated_by_older_file(self, tmp_path):
+        """Test that a replaced YAML file is reloaded even if it is older"""
+        config_path, cache_path = self._write_config(tmp_path, 'value: 1\n')
+        Config(config_path)
+
+        # Same size, older modification time (like cp -p or rsync -t)
+        config_path.write_text('value: 2\n')
+        old_time = cache_path.stat().st_mtime - 3600
+        os.utime(config_path, (old_time, old_time))
+
+        assert Config(config_path).config == {'value': 2}
+
+    def test_non_string_keys_not_cached(self, tmp_path):
+        """Test that configs JSON can't represent are always read from YAML"""
+        config_path, cache_path = self._write_config(tmp_path, '1: one\n')
+
+        assert Config(config_path).config == {1: 'one'}
+        assert not cache_path.exists()
+        assert Config(config_path).config == {1: 'one'}
+
+    def test_broken_cache_falls_back_to_yaml(self, tmp_path):
+        """Test that an unreadable cache is ignored and rewritten"""
+        config_path, cache_path = self._write_config(tmp_path, 'value: 1\n')
+        cache_path.write_text('{not json')
+
+        assert Config(config_path).config == {'value': 1}
+        assert json.loads(cache_path.read_text())['config'] == {'value': 1}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
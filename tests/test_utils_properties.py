@@ -0,0 +1,40 @@
+"""
+Property-based tests for the utils module
+
+Generates version strings with Hypothesis instead of listing them by hand.
+Skipped when hypothesis is not installed.
+"""
+
+import string
+
+import pytest
+
+pytest.importorskip('hypothesis')
+
+from hypothesis import given, strategies as st
+
+from src.utils import is_valid_version
+
+
+version_part = st.integers(min_value=0).map(str)
+version_core = st.tuples(version_part, version_part, version_part).map('.'.join)
+version_suffix = st.text(alphabet=string.ascii_letters + string.digits + '.', min_size=1)
+
+
+class TestVersionProperties:
+    """Test semantic version validation over generated versions"""
+
+    @given(version_core)
+    def test_core_version_is_valid(self, version):
+        """Test that any X.Y.Z version is accepted"""
+        assert is_valid_version(version) is True
+
+    @given(version_core, version_suffix)
+    def test_version_with_suffix_is_valid(self, version, suffix):
+        """Test that any X.Y.Z-suffix version is accepted"""
+        assert is_valid_version(f'{version}-{suffix}') is True
+
+    @given(st.lists(version_part, min_size=1, max_size=6).filter(lambda parts: len(parts) != 3))
+    def test_wrong_number_of_parts_is_invalid(self, parts):
+        """Test that versions without exactly three parts are rejected"""
+        assert is_valid_version('.'.join(parts)) is False